@@ -15,9 +15,66 @@ class Settings(BaseSettings):
     # Naver API Settings
     naver_client_id: str
     naver_client_secret: str
+    # 추가 네이버 API 키 목록 ("client_id:client_secret" 쌍을 쉼표로 구분)
+    naver_extra_credentials: str = ""
+    # 키 하나당 하루 호출 한도 (네이버 검색 API 기본 한도: 25,000회)
+    naver_daily_quota: int = 25000
+    # 키별 일일 사용량을 기록하는 SQLite 파일 경로
+    # (서버 워커와 배치 CLI가 함께 사용하며, 비어 있으면 프로세스 메모리에만 기록)
+    naver_quota_path: str = "data/naver_quota.db"
+    # 키 선택 전략 (round_robin: 순차 선택, least_used: 가장 적게 사용한 키 선택)
+    naver_credential_strategy: str = "round_robin"
+    # 동일한 검색 파라미터의 응답을 재사용할 시간 (초, 0이면 캐시 사용 안 함)
+    naver_search_cache_ttl: int = 60
 
     # OpenAI API Settings
     open_ai_api_key: str
+    # 동일한 프롬프트의 응답을 저장하는 SQLite 파일 경로
+    completion_cache_path: str = "data/completion_cache.db"
+    # 응답 캐시의 최대 용량 (MB)과 최대 항목 수
+    completion_cache_max_mb: int = 100
+    completion_cache_max_entries: int = 50000
+
+    # Crawler Settings
+    # 유휴 상태로 유지할 크롤러(Chrome) 수, 서버 시작 시 이 수만큼 미리 실행합니다.
+    # (0이면 요청마다 Chrome을 새로 실행합니다)
+    crawler_pool_size: int = 0
+    # 크롤링 단계별 소요 시간을 기록할 JSONL 파일 경로 (비어 있으면 기록하지 않음)
+    crawl_trace_path: str = ""
+    # 본문을 더 가벼운 모바일 PostView 페이지에서 가져올지 여부
+    crawler_prefer_mobile: bool = False
+
+    # Local Index Settings
+    # 크롤링한 포스트를 저장하는 SQLite 파일 경로
+    local_index_path: str = "data/blog_index.db"
+    # 로컬 인덱스만으로 응답하기 위해 필요한 최소 포스트 수
+    local_index_min_posts: int = 5
+    # 로컬 인덱스의 포스트를 최신으로 인정하는 기간 (시간)
+    local_index_max_age_hours: int = 168
+
+    # Summary Cache Settings
+    # 검색어별 리뷰 요약을 저장하는 SQLite 파일 경로
+    summary_cache_path: str = "data/summary_cache.db"
+    # 저장된 요약을 재사용하는 기간 (시간)
+    summary_cache_ttl_hours: int = 24
+    # 저장할 최대 요약 수
+    summary_cache_max_entries: int = 10000
+
+    # Ranking Settings
+    # 검색 결과 중 관련도 순으로 크롤링할 최대 포스트 수
+    crawl_top_k: int = 15
+    # 크롤링한 포스트 중 관련도 순으로 AI 분석에 전달할 최대 포스트 수
+    prompt_top_k: int = 10
+
+    # Admission Control Settings
+    # 동시에 분석할 최대 요청 수
+    admission_max_concurrent: int = 4
+    # 대기열에서 기다릴 수 있는 최대 요청 수
+    admission_max_queue: int = 20
+    # 대기열에서 기다리는 최대 시간 (초)
+    admission_max_queue_wait_seconds: float = 30.0
+    # 거절 응답의 Retry-After 헤더 값 (초)
+    admission_retry_after_seconds: int = 10
 
     # pydantic-settings 설정
     model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
@@ -0,0 +1,94 @@
+"""
+애플리케이션 시작/종료(lifespan) 처리 모듈
+
+서버가 시작될 때 서비스 객체를 미리 생성하고, 외부 API 연결과 크롤러를
+백그라운드에서 미리 준비(warm-up)합니다. 준비가 끝나기 전까지는
+준비 상태(readiness) 엔드포인트가 503을 반환하여 트래픽을 받지 않도록 합니다.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict
+
+from fastapi import FastAPI
+
+from app.dependencies import (
+    create_blog_review_service,
+    get_crawler_pool,
+    get_naver_api_service,
+    get_openai_service,
+    get_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupState:
+    """서버 준비 상태와 시작 단계별 소요 시간"""
+
+    ready: bool = False
+    import_seconds: float = 0.0
+    step_seconds: Dict[str, float] = field(default_factory=dict)
+    step_errors: Dict[str, str] = field(default_factory=dict)
+
+
+# 애플리케이션 전체에서 공유하는 시작 상태 객체
+startup_state = StartupState()
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[object]]) -> None:
+    """
+    시작 단계 하나를 실행하고 소요 시간을 기록합니다.
+
+    미리 준비하는 단계는 실패해도 서비스에는 지장이 없으므로 오류만 기록합니다.
+    """
+    started_at = time.perf_counter()
+    try:
+        await step()
+    except Exception as e:
+        startup_state.step_errors[name] = str(e)
+        logger.warning(f"시작 단계 실패 ({name}): {str(e)}")
+    finally:
+        startup_state.step_seconds[name] = time.perf_counter() - started_at
+
+
+async def _warm_up() -> None:
+    """외부 연결과 크롤러를 미리 준비한 뒤 준비 완료 상태로 전환합니다."""
+    settings = get_settings()
+    naver_api_service = get_naver_api_service(settings=settings)
+    openai_service = get_openai_service(settings=settings)
+    crawler_pool = get_crawler_pool(settings=settings)
+
+    await asyncio.gather(
+        _run_step("naver_connection", naver_api_service.warm_up),
+        _run_step(
+            "openai_connection", lambda: asyncio.to_thread(openai_service.warm_up)
+        ),
+        _run_step("crawler_prewarm", lambda: asyncio.to_thread(crawler_pool.prewarm)),
+    )
+
+    startup_state.ready = True
+    logger.info(f"서버 준비 완료: {startup_state}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 서비스를 준비하고, 종료 시 자원을 정리합니다."""
+    started_at = time.perf_counter()
+    # 의존성 싱글톤을 첫 요청 전에 미리 생성합니다.
+    create_blog_review_service()
+    startup_state.step_seconds["create_services"] = time.perf_counter() - started_at
+
+    warm_up_task = asyncio.create_task(_warm_up())
+    try:
+        yield
+    finally:
+        # 미리 실행 중인 크롤러가 종료 후에 남지 않도록 준비 작업이 끝날 때까지 기다립니다.
+        await warm_up_task
+        settings = get_settings()
+        await get_naver_api_service(settings=settings).aclose()
+        await asyncio.to_thread(get_crawler_pool(settings=settings).close)
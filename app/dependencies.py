@@ -10,9 +10,15 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.core.config import Settings
+from app.services.admission_controller import AdmissionController
 from app.services.ai_service import OpenAIService
 from app.services.naver_api_service import NaverApiService
 from app.services.blog_review_service import BlogReviewService
+from app.services.post_index_service import PostIndexService
+from app.services.relevance_ranker import RelevanceRanker
+from app.utils.cache_utils import SqliteCache
+from crawler.crawler_pool import CrawlerPool
+from crawler.utils.crawl_tracer import CrawlTracer
 
 
 # @lru_cache를 사용하여 각 함수가 처음 호출될 때의 반환 값을 캐싱합니다.
@@ -41,13 +47,100 @@ def get_naver_api_service(
     return NaverApiService(settings=settings)
 
 
+@lru_cache
+def get_crawler_pool(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> CrawlerPool:
+    """크롤러 풀 객체를 생성하여 반환합니다."""
+    return CrawlerPool(
+        max_idle=settings.crawler_pool_size,
+        headless=True,
+        tracer=CrawlTracer(path=settings.crawl_trace_path or None),
+        prefer_mobile=settings.crawler_prefer_mobile,
+    )
+
+
+@lru_cache
+def get_post_index_service(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> PostIndexService:
+    """크롤링한 포스트의 로컬 검색 인덱스 서비스 객체를 생성하여 반환합니다."""
+    return PostIndexService(
+        db_path=settings.local_index_path,
+        min_posts=settings.local_index_min_posts,
+        max_age_hours=settings.local_index_max_age_hours,
+    )
+
+
+@lru_cache
+def get_relevance_ranker() -> RelevanceRanker:
+    """검색어 관련도 순위 계산기 객체를 생성하여 반환합니다."""
+    return RelevanceRanker()
+
+
+@lru_cache
+def get_summary_cache(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> SqliteCache:
+    """검색어별 리뷰 요약 캐시 객체를 생성하여 반환합니다."""
+    return SqliteCache(
+        db_path=settings.summary_cache_path,
+        max_entries=settings.summary_cache_max_entries,
+        ttl_seconds=settings.summary_cache_ttl_hours * 3600,
+    )
+
+
 @lru_cache
 def get_blog_review_service(
+    settings: Annotated[Settings, Depends(get_settings)],
     naver_api_service: Annotated[NaverApiService, Depends(get_naver_api_service)],
     openai_service: Annotated[OpenAIService, Depends(get_openai_service)],
+    crawler_pool: Annotated[CrawlerPool, Depends(get_crawler_pool)],
+    post_index_service: Annotated[PostIndexService, Depends(get_post_index_service)],
+    relevance_ranker: Annotated[RelevanceRanker, Depends(get_relevance_ranker)],
+    summary_cache: Annotated[SqliteCache, Depends(get_summary_cache)],
 ) -> BlogReviewService:
     """블로그 리뷰 서비스(오케스트레이터) 객체를 생성하여 반환합니다."""
     return BlogReviewService(
         naver_api_service=naver_api_service,
         openai_service=openai_service,
+        crawler_pool=crawler_pool,
+        post_index_service=post_index_service,
+        relevance_ranker=relevance_ranker,
+        summary_cache=summary_cache,
+        crawl_limit=settings.crawl_top_k,
+        prompt_limit=settings.prompt_top_k,
+    )
+
+
+@lru_cache
+def get_admission_controller(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> AdmissionController:
+    """블로그 분석 요청의 수락 제어기 객체를 생성하여 반환합니다."""
+    return AdmissionController(
+        max_concurrent=settings.admission_max_concurrent,
+        max_queue=settings.admission_max_queue,
+        max_queue_wait_seconds=settings.admission_max_queue_wait_seconds,
+        retry_after_seconds=settings.admission_retry_after_seconds,
+    )
+
+
+def create_blog_review_service() -> BlogReviewService:
+    """
+    FastAPI 요청 밖(서버 시작, 배치 CLI 등)에서 블로그 리뷰 서비스를 생성합니다.
+
+    FastAPI는 의존성 함수를 키워드 인자로 호출하고, lru_cache는 위치 인자와 키워드 인자를
+    서로 다른 키로 저장합니다. 요청 처리 시와 같은 싱글톤 객체를 사용하도록
+    여기서도 같은 이름의 키워드 인자로 호출합니다.
+    """
+    settings = get_settings()
+    return get_blog_review_service(
+        settings=settings,
+        naver_api_service=get_naver_api_service(settings=settings),
+        openai_service=get_openai_service(settings=settings),
+        crawler_pool=get_crawler_pool(settings=settings),
+        post_index_service=get_post_index_service(settings=settings),
+        relevance_ranker=get_relevance_ranker(),
+        summary_cache=get_summary_cache(settings=settings),
     )
@@ -1,17 +1,27 @@
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+import time
 
-from app.routers import blog_router
+# 애플리케이션 모듈 로딩 시간을 측정하기 위해 다른 모듈보다 먼저 기록합니다.
+_import_started_at = time.perf_counter()
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.staticfiles import StaticFiles  # noqa: E402
+from fastapi.responses import FileResponse  # noqa: E402
+
+from app.core.lifespan import lifespan, startup_state  # noqa: E402
+from app.routers import blog_router, health_router  # noqa: E402
+
+startup_state.import_seconds = time.perf_counter() - _import_started_at
 
 app = FastAPI(
     title="Blog Review API",
     description="네이버 블로그 검색을 통한 리뷰 분석 API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # 라우터 등록
 app.include_router(blog_router.router)
+app.include_router(health_router.router)
 
 # 정적 파일 서빙을 위한 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
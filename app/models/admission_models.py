@@ -0,0 +1,21 @@
+"""
+요청 수락 제어(admission control) 응답 모델
+"""
+
+from pydantic import BaseModel, Field
+
+
+class AdmissionMetricsResponse(BaseModel):
+    """
+    요청 수락 제어(admission control) 상태와 누적 지표를 나타내는 모델
+    """
+
+    in_flight: int = Field(..., description="현재 처리 중인 요청 수")
+    queue_length: int = Field(..., description="현재 대기 중인 요청 수")
+    max_concurrent: int = Field(..., description="동시에 처리할 최대 요청 수")
+    max_queue: int = Field(..., description="대기열의 최대 길이")
+    admitted: int = Field(..., description="처리를 시작한 요청 수")
+    queued: int = Field(..., description="대기열을 거친 요청 수")
+    shed: int = Field(..., description="대기열이 가득 차 거절된 요청 수")
+    timed_out: int = Field(..., description="대기 시간 초과로 거절된 요청 수")
+    cache_served: int = Field(..., description="대기열 없이 캐시로 응답한 요청 수")
@@ -0,0 +1,22 @@
+"""
+서버 상태 확인(헬스체크) 응답 모델
+"""
+
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class ReadinessResponse(BaseModel):
+    """
+    서버 준비 상태와 시작 소요 시간 보고서를 나타내는 모델
+    """
+
+    ready: bool = Field(..., description="트래픽을 받을 준비가 되었는지 여부")
+    import_seconds: float = Field(..., description="애플리케이션 모듈 로딩 시간 (초)")
+    step_seconds: Dict[str, float] = Field(
+        default_factory=dict, description="시작 단계별 소요 시간 (초)"
+    )
+    step_errors: Dict[str, str] = Field(
+        default_factory=dict, description="실패한 시작 단계와 오류 메시지"
+    )
@@ -0,0 +1,221 @@
+"""
+리뷰 요약 사전 계산(precompute) 배치 CLI
+
+자주 검색되는 검색어 목록을 미리 분석하여, 크롤링한 포스트는 로컬 인덱스에,
+리뷰 요약은 요약 캐시에 저장합니다. 서버는 같은 캐시 파일을 사용하므로
+실제 요청이 들어오면 미리 계산된 결과로 바로 응답할 수 있습니다.
+
+처리한 검색어는 체크포인트 파일에 기록되므로, 중간에 중단되어도
+같은 명령을 다시 실행하면 완료되지 않은 검색어부터 이어서 처리합니다.
+
+사용법:
+    python -m app.precompute queries.txt --concurrency 2 --rate 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import List, Set
+
+from app.dependencies import (
+    create_blog_review_service,
+    get_crawler_pool,
+    get_naver_api_service,
+    get_settings,
+)
+from app.services.blog_review_service import BlogReviewService
+
+logger = logging.getLogger(__name__)
+
+
+def read_queries(path: str) -> List[str]:
+    """검색어 파일을 읽습니다. (한 줄에 하나, 빈 줄과 # 주석은 무시, 중복 제거)"""
+    queries: List[str] = []
+    seen: Set[str] = set()
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        query = " ".join(line.split())
+        if query and not query.startswith("#") and query not in seen:
+            seen.add(query)
+            queries.append(query)
+    return queries
+
+
+def read_completed_queries(checkpoint_path: str) -> Set[str]:
+    """체크포인트 파일에서 성공적으로 처리된 검색어 목록을 읽습니다."""
+    path = Path(checkpoint_path)
+    if not path.exists():
+        return set()
+
+    completed = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if record.get("status") == "ok":
+            completed.add(record["query"])
+    return completed
+
+
+class RateLimiter:
+    """작업 시작 간격을 일정하게 유지하여 초당 실행 횟수를 제한하는 클래스"""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """다음 작업을 시작해도 될 때까지 기다립니다."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Precomputer:
+    """검색어 목록을 병렬로 분석하고 진행 상황을 체크포인트에 기록하는 클래스"""
+
+    def __init__(
+        self,
+        service: BlogReviewService,
+        checkpoint_path: str,
+        concurrency: int,
+        rate_per_second: float,
+        refresh: bool,
+    ):
+        self.service = service
+        self.checkpoint_path = Path(checkpoint_path)
+        self.concurrency = concurrency
+        self.rate_limiter = RateLimiter(rate_per_second)
+        self.refresh = refresh
+        self.succeeded = 0
+        self.failed = 0
+
+    async def run(self, queries: List[str]) -> None:
+        """작업 큐에 검색어를 넣고 concurrency 개의 작업자로 처리합니다."""
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        queue: asyncio.Queue = asyncio.Queue()
+        for query in queries:
+            queue.put_nowait(query)
+
+        workers = [
+            asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)
+        ]
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            query = await queue.get()
+            try:
+                await self.rate_limiter.wait()
+                await self._process(query)
+            finally:
+                queue.task_done()
+
+    async def _process(self, query: str) -> None:
+        started_at = time.perf_counter()
+        try:
+            analysis = await self.service.analyze_reviews_with_status(
+                query, refresh=self.refresh
+            )
+            summary = analysis.summary
+            # 저장된 요약이 있거나 새 요약을 저장한 경우에만 완료로 기록합니다.
+            status = (
+                "ok" if analysis.status in ("cached", "stored") else analysis.status
+            )
+        except Exception as e:
+            logger.error(f"사전 계산 실패 ({query}): {str(e)}")
+            summary, status = "", "error"
+
+        if status == "ok":
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+        duration = time.perf_counter() - started_at
+        self._write_checkpoint(query, status, duration)
+        print(f"[{status}] {query} ({duration:.1f}초, 요약 {len(summary)}자)")
+
+    def _write_checkpoint(self, query: str, status: str, duration: float) -> None:
+        record = {
+            "query": query,
+            "status": status,
+            "duration_seconds": round(duration, 2),
+            "finished_at": time.time(),
+        }
+        with open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+async def precompute(args: argparse.Namespace) -> None:
+    queries = read_queries(args.queries)
+    completed = set() if args.restart else read_completed_queries(args.checkpoint)
+    pending = [query for query in queries if query not in completed]
+    print(
+        f"전체 검색어 {len(queries)}개 중 완료 {len(queries) - len(pending)}개, "
+        f"남은 검색어 {len(pending)}개"
+    )
+
+    service = create_blog_review_service()
+    precomputer = Precomputer(
+        service=service,
+        checkpoint_path=args.checkpoint,
+        concurrency=args.concurrency,
+        rate_per_second=args.rate,
+        refresh=args.refresh,
+    )
+    try:
+        await precomputer.run(pending)
+    finally:
+        settings = get_settings()
+        await get_naver_api_service(settings=settings).aclose()
+        get_crawler_pool(settings=settings).close()
+
+    print(f"완료: 성공 {precomputer.succeeded}개, 실패 {precomputer.failed}개")
+
+
+def positive_int(value: str) -> int:
+    """1 이상의 정수만 허용하는 argparse 타입"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("1 이상의 정수여야 합니다.")
+    return number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리뷰 요약 사전 계산")
+    parser.add_argument("queries", help="검색어 목록 파일 (한 줄에 하나)")
+    parser.add_argument(
+        "--concurrency", type=positive_int, default=2, help="동시에 분석할 검색어 수"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=0.5, help="초당 시작할 최대 검색어 수"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default="data/precompute_checkpoint.jsonl",
+        help="진행 상황을 기록할 체크포인트 파일",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="저장된 요약이 있어도 다시 분석"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(precompute(args))
+
+
+if __name__ == "__main__":
+    main()
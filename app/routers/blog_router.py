@@ -4,11 +4,14 @@
 이 모듈은 블로그 리뷰 분석 관련 API 엔드포인트를 정의합니다.
 """
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from app.dependencies import get_blog_review_service
+from app.dependencies import get_admission_controller, get_blog_review_service
+from app.models.admission_models import AdmissionMetricsResponse
+from app.services.admission_controller import AdmissionController, AdmissionRejected
 from app.services.blog_review_service import BlogReviewService
 
 # 라우터 인스턴스 생성
@@ -18,6 +21,7 @@ router = APIRouter(
     responses={
         404: {"description": "Not found"},
         500: {"description": "Internal server error"},
+        503: {"description": "Server is busy (retry after Retry-After seconds)"},
     },
 )
 
@@ -30,6 +34,7 @@ router = APIRouter(
 )
 async def search_blogs_and_analyze(
     service: Annotated[BlogReviewService, Depends(get_blog_review_service)],
+    admission: Annotated[AdmissionController, Depends(get_admission_controller)],
     query: str = Query(
         ...,
         description="분석할 검색어 (예: '대전 맛집')",
@@ -39,8 +44,15 @@ async def search_blogs_and_analyze(
     ),
 ) -> str:
     try:
-        # 서비스 레이어에 비즈니스 로직 처리를 위임합니다.
-        result = await service.analyze_reviews(query=query)
+        # 미리 계산된 요약이 있으면 대기열을 거치지 않고 바로 응답합니다.
+        cached_summary = await asyncio.to_thread(service.get_cached_summary, query)
+        if cached_summary is not None:
+            admission.record_cache_served()
+            return cached_summary
+
+        # 처리 자리를 얻은 뒤 서비스 레이어에 비즈니스 로직 처리를 위임합니다.
+        async with admission.slot():
+            result = await service.analyze_reviews(query=query)
 
         # 디버깅용 로그 (결과 확인 시 사용)
         # print("최종 AI 답변:", result)
@@ -50,8 +62,27 @@ async def search_blogs_and_analyze(
     except HTTPException as e:
         # 서비스 레이어에서 발생한 HTTP 예외는 그대로 다시 발생시킵니다.
         raise e
+    except AdmissionRejected as e:
+        # 서버가 포화 상태이면 503과 함께 다시 시도할 시점을 알려줍니다.
+        raise HTTPException(
+            status_code=503,
+            detail=f"Server is busy ({e.reason}), please retry later",
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except Exception as e:
         # 그 외 예상치 못한 오류를 처리합니다.
         # 실제 운영 환경에서는 에러 로깅이 중요합니다.
         # logger.error(f"An unexpected error occurred: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+
+
+@router.get(
+    "/admission",
+    response_model=AdmissionMetricsResponse,
+    summary="요청 수락 제어 지표",
+    description="처리 중/대기 중인 요청 수와 수락, 대기, 거절된 요청의 누적 횟수를 반환합니다.",
+)
+async def get_admission_metrics(
+    admission: Annotated[AdmissionController, Depends(get_admission_controller)],
+) -> AdmissionMetricsResponse:
+    return AdmissionMetricsResponse(**admission.metrics())
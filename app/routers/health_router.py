@@ -0,0 +1,37 @@
+"""
+서버 상태 확인(헬스체크) API 라우터
+
+이 모듈은 서버의 생존(liveness) 및 준비(readiness) 상태를 확인하는 엔드포인트를 정의합니다.
+"""
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Response, status
+
+from app.core.lifespan import startup_state
+from app.models.health_models import ReadinessResponse
+
+router = APIRouter(
+    prefix="/health",
+    tags=["헬스체크"],
+)
+
+
+@router.get("/live", summary="서버 생존 확인")
+async def check_liveness() -> dict:
+    # 프로세스가 요청에 응답할 수 있으면 항상 성공을 반환합니다.
+    return {"status": "ok"}
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    summary="서버 준비 상태 확인",
+    description="서비스 준비(warm-up)가 끝났는지와 시작 단계별 소요 시간을 반환합니다.",
+)
+async def check_readiness(response: Response) -> ReadinessResponse:
+    # 준비가 끝나기 전에는 503을 반환하여 로드밸런서가 트래픽을 보내지 않도록 합니다.
+    if not startup_state.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return ReadinessResponse(**asdict(startup_state))
@@ -0,0 +1,150 @@
+"""
+요청 수락 제어(admission control) 모듈
+
+크롤링과 AI 분석은 요청 하나당 수십 초와 많은 메모리를 사용하므로, 동시에 처리하는
+요청 수를 제한하고 나머지는 대기열에서 기다리게 합니다. 대기열이 가득 찼거나
+대기 시간이 너무 길어지면 요청을 바로 거절(load shedding)하여 서버 전체가
+함께 느려지거나 메모리 부족으로 멈추는 것을 막습니다.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """서버가 포화 상태라 요청을 받지 않을 때 발생하는 예외"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    동시 처리 수와 대기열 길이를 제한하는 클래스
+
+    하나의 이벤트 루프 안에서만 사용하므로 별도의 잠금 없이 상태를 변경합니다.
+    처리 중인 요청이 끝나면 대기열의 가장 오래된 요청에 처리 자리를 바로 넘겨줍니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        max_queue_wait_seconds: float,
+        retry_after_seconds: int,
+    ):
+        """
+        요청 수락 제어기 초기화
+
+        Args:
+            max_concurrent: 동시에 처리할 최대 요청 수
+            max_queue: 대기열에서 기다릴 수 있는 최대 요청 수
+            max_queue_wait_seconds: 대기열에서 기다리는 최대 시간 (초)
+            retry_after_seconds: 거절 응답의 Retry-After 헤더 값 (초)
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self.retry_after_seconds = retry_after_seconds
+
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # 지표(metrics) 카운터
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+        self.timed_out = 0
+        self.cache_served = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        처리 자리를 얻은 동안 블록 안의 작업을 실행합니다.
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def record_cache_served(self) -> None:
+        """대기열을 거치지 않고 캐시로 응답한 요청을 기록합니다."""
+        self.cache_served += 1
+
+    def metrics(self) -> Dict[str, int]:
+        """현재 상태와 누적 지표를 반환합니다."""
+        return {
+            "in_flight": self._in_flight,
+            "queue_length": len(self._waiters),
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+            "cache_served": self.cache_served,
+        }
+
+    async def _acquire(self) -> None:
+        # 1. 빈 자리가 있고 먼저 기다리는 요청이 없으면 바로 처리합니다.
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            self.admitted += 1
+            return
+
+        # 2. 대기열도 가득 찼으면 기다리게 하지 않고 바로 거절합니다.
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            logger.warning(f"요청 거절 (대기열 포화): {self.metrics()}")
+            raise AdmissionRejected("queue_full", self.retry_after_seconds)
+
+        # 3. 대기열에서 자리를 넘겨받을 때까지 기다립니다.
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(waiter, timeout=self.max_queue_wait_seconds)
+        except asyncio.TimeoutError:
+            # 시간 초과와 동시에 자리를 넘겨받았다면 그대로 처리합니다.
+            if waiter.done() and not waiter.cancelled():
+                self.admitted += 1
+                return
+            self._remove_waiter(waiter)
+            self.timed_out += 1
+            logger.warning(f"요청 거절 (대기 시간 초과): {self.metrics()}")
+            raise AdmissionRejected("queue_timeout", self.retry_after_seconds)
+        except asyncio.CancelledError:
+            # 클라이언트 연결이 끊긴 경우: 이미 넘겨받은 자리는 반납합니다.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            else:
+                self._remove_waiter(waiter)
+            raise
+
+        self.admitted += 1
+
+    def _release(self) -> None:
+        # 기다리는 요청이 있으면 처리 중인 수를 줄이지 않고 자리를 그대로 넘겨줍니다.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
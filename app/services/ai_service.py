@@ -1,35 +1,95 @@
+import hashlib
+import json
 import logging
-from openai import OpenAI
-from typing import List
+from typing import Dict, List, Optional
 
 from app.core.config import Settings
 from app.models.naver_models import NaverBlogCrawledResponse
+from app.utils.cache_utils import SqliteCache
 from app.utils.prompt_utils import generate_prompt, system_prompt
 
 logger = logging.getLogger(__name__)
 
 
 class OpenAIService:
+    # API 호출 실패 시 반환하는 안내 문구 (캐시에 저장하지 않도록 구분하는 데 사용)
+    ERROR_MESSAGE = "리뷰 분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+
     def __init__(self, settings: Settings):
+        # openai 패키지는 불러오는 데 시간이 걸리므로 서비스 생성 시점에 불러옵니다.
+        from openai import OpenAI
+
         self.model = "gpt-4o-mini"
+        self.temperature = 0.7
+        self.max_tokens = 2000
         self.client = OpenAI(api_key=settings.open_ai_api_key)
+        # 모델, 파라미터, 프롬프트가 모두 같은 요청은 저장된 답변을 재사용합니다.
+        self.completion_cache = SqliteCache(
+            db_path=settings.completion_cache_path,
+            max_entries=settings.completion_cache_max_entries,
+            max_bytes=settings.completion_cache_max_mb * 1024 * 1024,
+        )
+
+    def warm_up(self) -> None:
+        """OpenAI API 서버와의 연결을 미리 맺어 둡니다. (과금되지 않는 모델 목록 조회)"""
+        self.client.with_options(timeout=5.0).models.list()
+
+    def _completion_cache_key(self, messages: List[Dict[str, str]]) -> str:
+        """
+        요청 내용 전체의 해시값을 캐시 키로 사용합니다.
+
+        검색어가 달라도 선택된 포스트(순서 포함)가 같으면 같은 키가 됩니다.
+        """
+        request = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "messages": messages,
+        }
+        serialized = json.dumps(request, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
     def generate_response(self, crawled_data: List[NaverBlogCrawledResponse]) -> str:
         try:
             user_prompt = generate_prompt(crawled_data)
+            messages = [
+                {"role": "system", "content": system_prompt()},
+                {"role": "user", "content": user_prompt},
+            ]
+
+            cache_key = self._completion_cache_key(messages)
+            cached_response = self._get_cached_completion(cache_key)
+            if cached_response is not None:
+                logger.info(f"OpenAI 응답 캐시 적중: {cache_key[:12]}")
+                return cached_response
 
             completion = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt()},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.7,
-                max_tokens=2000,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
             )
-
-            return completion.choices[0].message.content
+            response = completion.choices[0].message.content
 
         except Exception as e:
             logger.error(f"OpenAI API 호출 중 오류 발생: {e}")
-            return "리뷰 분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+            return self.ERROR_MESSAGE
+
+        if response:
+            self._store_completion(cache_key, response)
+        return response
+
+    def _get_cached_completion(self, cache_key: str) -> Optional[str]:
+        """저장된 응답을 조회합니다. (캐시 오류 시 API를 호출하도록 None 반환)"""
+        try:
+            return self.completion_cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"OpenAI 응답 캐시 조회 실패: {e}")
+            return None
+
+    def _store_completion(self, cache_key: str, response: str) -> None:
+        """응답을 저장합니다. (저장에 실패해도 응답은 그대로 사용)"""
+        try:
+            self.completion_cache.set(cache_key, response)
+        except Exception as e:
+            logger.warning(f"OpenAI 응답 캐시 저장 실패: {e}")
@@ -5,44 +5,167 @@
 import logging
 import asyncio
 import time
-from typing import List
+from typing import List, NamedTuple, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 from app.models.naver_models import BlogSearchRequest, NaverBlogCrawledResponse
 from app.services.ai_service import OpenAIService
 from app.services.naver_api_service import NaverApiService
-from crawler.naver_blog_crawler import NaverBlogCrawler
+from app.services.post_index_service import PostIndexService
+from app.services.relevance_ranker import RelevanceRanker
+from app.utils.cache_utils import SqliteCache
+from crawler.crawler_pool import CrawlerPool
+from crawler.utils.content_normalizer import ContentNormalizer
 
 logger = logging.getLogger(__name__)
 
 
+class ReviewAnalysis(NamedTuple):
+    """
+    리뷰 분석 결과와 처리 상태
+
+    status:
+        - cached: 저장된 요약을 그대로 반환함
+        - stored: 새로 분석하여 요약 캐시에 저장함
+        - no_result: 분석할 포스트를 찾지 못함
+        - error: AI 분석에 실패함 (요약은 저장하지 않음)
+    """
+
+    summary: str
+    status: str
+
+
 class BlogReviewService:
+    NO_RESULT_MESSAGE = (
+        "분석할 최신 블로그를 찾지 못했습니다. 다른 검색어로 시도해주세요."
+    )
+
     def __init__(
         self,
         naver_api_service: NaverApiService,
         openai_service: OpenAIService,
+        crawler_pool: CrawlerPool,
+        post_index_service: PostIndexService,
+        relevance_ranker: RelevanceRanker,
+        summary_cache: SqliteCache,
+        crawl_limit: int = 15,
+        prompt_limit: int = 10,
     ):
         self.naver_api_service = naver_api_service
         self.openai_service = openai_service
+        self.crawler_pool = crawler_pool
+        self.post_index_service = post_index_service
+        self.relevance_ranker = relevance_ranker
+        self.summary_cache = summary_cache
+        # 크롤링할 최대 포스트 수와 AI 분석에 전달할 최대 포스트 수
+        self.crawl_limit = crawl_limit
+        self.prompt_limit = prompt_limit
+        self.content_normalizer = ContentNormalizer()
 
     def _crawl_single_url(self, url: str) -> dict:
         try:
-            with NaverBlogCrawler(headless=True) as crawler:
-                return crawler.get_blog_content(url)
+            crawler = self.crawler_pool.acquire()
         except Exception as e:
             logger.error(f"블로그 크롤링 실패 ({url}): {str(e)}")
             return {"error": f"크롤링 실패: {str(e)}"}
 
-    async def analyze_reviews(self, query: str) -> str:
+        healthy = False
+        try:
+            result = crawler.get_blog_content(url)
+            healthy = "error" not in result
+        except Exception as e:
+            logger.error(f"블로그 크롤링 실패 ({url}): {str(e)}")
+            return {"error": f"크롤링 실패: {str(e)}"}
+        finally:
+            # 오류가 발생한 크롤러는 재사용하지 않고 종료합니다.
+            self.crawler_pool.release(crawler, healthy=healthy)
+
+        if "error" not in result:
+            self._normalize_content(result)
+        return result
+
+    def _normalize_content(self, result: dict) -> None:
+        """크롤링한 본문에서 보일러플레이트를 제거하고 줄어든 바이트 수를 기록합니다."""
+        normalized = self.content_normalizer.normalize(result.get("content", ""))
+        result["content"] = normalized.text
+        logger.info(
+            f"본문 정제 완료 ({result.get('url')}): "
+            f"{normalized.original_bytes}B -> {normalized.normalized_bytes}B "
+            f"({normalized.reduction_ratio:.1%} 감소)"
+        )
+
+    @staticmethod
+    def _summary_cache_key(query: str) -> str:
+        # 공백 차이만 있는 검색어는 같은 요약을 사용합니다.
+        return " ".join(query.split())
+
+    def get_cached_summary(self, query: str) -> Optional[str]:
+        """미리 계산해 둔 리뷰 요약이 있으면 반환합니다."""
+        return self.summary_cache.get(self._summary_cache_key(query))
+
+    async def analyze_reviews(self, query: str, refresh: bool = False) -> str:
+        """
+        검색어에 대한 블로그 리뷰 요약을 생성합니다.
+
+        Args:
+            query: 검색어
+            refresh: True이면 저장된 요약을 무시하고 새로 분석합니다.
+        """
+        analysis = await self.analyze_reviews_with_status(query, refresh=refresh)
+        return analysis.summary
+
+    async def analyze_reviews_with_status(
+        self, query: str, refresh: bool = False
+    ) -> ReviewAnalysis:
+        """리뷰 요약과 함께 요약이 저장되었는지 등의 처리 상태를 반환합니다."""
+        # 0. 미리 계산해 둔 요약이 있으면 바로 반환합니다.
+        if not refresh:
+            cached_summary = await asyncio.to_thread(self.get_cached_summary, query)
+            if cached_summary is not None:
+                return ReviewAnalysis(cached_summary, "cached")
+
+        # 1. 로컬 인덱스에 충분히 많은 최신 포스트가 있으면 검색/크롤링을 생략합니다.
+        crawled_data_list = await asyncio.to_thread(
+            self.post_index_service.lookup, query
+        )
+
+        # 2. 부족하면 네이버 검색 후 크롤링하고, 결과를 로컬 인덱스에 저장합니다.
+        if crawled_data_list is None:
+            crawled_data_list = await self._search_and_crawl(query)
+            await asyncio.to_thread(
+                self.post_index_service.add_posts, crawled_data_list
+            )
+
+        if not crawled_data_list:
+            return ReviewAnalysis(self.NO_RESULT_MESSAGE, "no_result")
+
+        # 3. 검색어와 관련도가 높은 포스트만 골라 AI 서비스에 전달하여 분석 요청
+        crawled_data_list = self.relevance_ranker.rank_posts(
+            query, crawled_data_list, limit=self.prompt_limit
+        )
+        # (API 응답을 기다리는 동안 다른 요청이 처리되도록 별도 스레드에서 호출합니다)
+        final_review = await asyncio.to_thread(
+            self.openai_service.generate_response, crawled_data_list
+        )
+
+        # 4. 정상적으로 생성된 요약만 저장하여 다음 요청에 재사용합니다.
+        if final_review == self.openai_service.ERROR_MESSAGE:
+            return ReviewAnalysis(final_review, "error")
+
+        await asyncio.to_thread(
+            self.summary_cache.set, self._summary_cache_key(query), final_review
+        )
+        return ReviewAnalysis(final_review, "stored")
+
+    async def _search_and_crawl(self, query: str) -> List[NaverBlogCrawledResponse]:
         # 1. 네이버 API를 통해 블로그 검색
         search_request = BlogSearchRequest(query=query)
         search_result = await self.naver_api_service.search_blogs(search_request)
 
-        # 2. 최신순으로 정렬 후, 지정된 개수만큼 선택
-        sorted_items = sorted(
-            search_result.items, key=lambda x: x.post_date, reverse=True
+        # 2. 검색어 관련도와 최신성으로 정렬 후, 지정된 개수만큼 선택
+        target_items = self.relevance_ranker.rank_items(
+            query, search_result.items, limit=self.crawl_limit
         )
-        target_items = sorted_items
 
         # 3. 멀티스레딩을 사용한 병렬 크롤링
         crawled_data_list: List[NaverBlogCrawledResponse] = []
@@ -76,10 +199,4 @@ class BlogReviewService:
             f"총 소요시간 {crawling_duration:.2f}초, 성공한 블로그 수: {len(crawled_data_list)}"
         )
 
-        if not crawled_data_list:
-            return "분석할 최신 블로그를 찾지 못했습니다. 다른 검색어로 시도해주세요."
-
-        # 4. 크롤링된 데이터를 AI 서비스에 전달하여 분석 요청
-        final_review = self.openai_service.generate_response(crawled_data_list)
-
-        return final_review
+        return crawled_data_list
@@ -1,8 +1,9 @@
+import asyncio
 import httpx
 import re
 import logging
 from fastapi import HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.core.config import Settings
 from app.models.naver_models import (
@@ -10,19 +11,35 @@ from app.models.naver_models import (
     BlogSearchRequest,
     BlogItem,
 )
+from app.services.naver_credential_pool import NaverCredentialPool
+from app.utils.cache_utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
 class NaverApiService:
+    # 429 응답 중 일일 호출 한도 소진을 나타내는 네이버 오류 코드
+    QUOTA_EXCEEDED_ERROR_CODE = "010"
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self.base_url = "https://openapi.naver.com/v1/search/blog.json"
         self.headers = {
-            "X-Naver-Client-Id": self.settings.naver_client_id,
-            "X-Naver-Client-Secret": self.settings.naver_client_secret,
             "User-Agent": "Blog-Review-App/1.0",
         }
+        self.credential_pool = NaverCredentialPool.from_settings(settings)
+        # 동일한 검색 파라미터로 짧은 시간 안에 다시 호출하면 캐시된 응답을 반환합니다.
+        self.search_cache = TTLCache(ttl_seconds=settings.naver_search_cache_ttl)
+        # 연결을 재사용하기 위해 요청마다 새로 만들지 않고 하나의 클라이언트를 공유합니다.
+        self.client = httpx.AsyncClient()
+
+    async def warm_up(self) -> None:
+        """네이버 API 서버와의 연결(TLS 핸드셰이크 포함)을 미리 맺어 둡니다."""
+        await self.client.head(self.base_url, headers=self.headers, timeout=5.0)
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트를 종료합니다."""
+        await self.client.aclose()
 
     def _remove_html_tags(self, text: str) -> str:
         # HTML 태그 제거 정규식 패턴
@@ -46,18 +63,18 @@ class NaverApiService:
             "sort": "sim",  # 정확도 순으로 정렬
         }
 
+        cache_key = tuple(sorted(params.items()))
+        cached_response = self.search_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info(f"네이버 검색 캐시 적중: {search_params.query}")
+            return cached_response
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0,
-                )
-                response.raise_for_status()  # 2xx 이외의 상태 코드에 대해 예외 발생
+            json_data = await self._request_with_failover(params)
 
-                json_data = response.json()
-                return self._parse_response(json_data)
+            search_response = self._parse_response(json_data)
+            self.search_cache.set(cache_key, search_response)
+            return search_response
 
         except httpx.TimeoutException:
             raise HTTPException(status_code=504, detail="Naver API request timeout")
@@ -72,6 +89,60 @@ class NaverApiService:
         except httpx.RequestError as e:
             raise HTTPException(status_code=502, detail=f"Network error: {str(e)}")
 
+    async def _request_with_failover(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        키 풀에서 키를 골라 요청하고, 429/401 응답이면 다른 키로 다시 시도합니다.
+
+        Raises:
+            httpx.HTTPStatusError: 모든 키가 실패했거나 재시도 대상이 아닌 오류인 경우
+            HTTPException: 사용 가능한 키가 처음부터 없는 경우
+        """
+        last_error: Optional[httpx.HTTPStatusError] = None
+
+        # 키 선택 시 사용량 파일을 읽고 쓰므로 별도 스레드에서 호출합니다.
+        while (
+            credential := await asyncio.to_thread(self.credential_pool.acquire)
+        ) is not None:
+            response = await self.client.get(
+                self.base_url,
+                headers={**self.headers, **credential.headers},
+                params=params,
+                timeout=10.0,
+            )
+            try:
+                response.raise_for_status()  # 2xx 이외의 상태 코드에 대해 예외 발생
+            except httpx.HTTPStatusError as e:
+                if self._is_quota_exceeded(e.response):
+                    await asyncio.to_thread(
+                        self.credential_pool.mark_quota_exhausted, credential
+                    )
+                elif e.response.status_code == 429:
+                    self.credential_pool.mark_rate_limited(credential)
+                elif e.response.status_code == 401:
+                    self.credential_pool.mark_invalid(credential)
+                else:
+                    raise
+                last_error = e
+                continue
+
+            return response.json()
+
+        if last_error is not None:
+            raise last_error
+        raise HTTPException(
+            status_code=429, detail="All Naver API credentials are exhausted"
+        )
+
+    def _is_quota_exceeded(self, response: httpx.Response) -> bool:
+        """429 응답이 일시적인 속도 제한이 아니라 일일 한도 소진인지 확인합니다."""
+        if response.status_code != 429:
+            return False
+        try:
+            error_code = response.json().get("errorCode")
+        except (ValueError, AttributeError):
+            return False
+        return error_code == self.QUOTA_EXCEEDED_ERROR_CODE
+
     def _parse_response(self, json_data: Dict[str, Any]) -> NaverBlogSearchResponse:
         blog_items = [
             BlogItem(
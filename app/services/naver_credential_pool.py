@@ -0,0 +1,320 @@
+"""
+네이버 API 키(Client ID/Secret) 풀 관리 모듈
+
+여러 개의 네이버 API 키를 등록해 두고, 키별 일일 사용량을 기록하며
+호출할 키를 순차(round_robin) 또는 최소 사용(least_used) 방식으로 선택합니다.
+한도 초과(429)나 인증 실패(401)가 발생한 키는 일정 시간 또는 영구적으로 제외합니다.
+
+일일 사용량은 SQLite 파일에 기록하므로 재시작 후에도 유지되고,
+같은 키를 사용하는 여러 서버 워커와 배치 CLI가 하나의 한도를 함께 나누어 씁니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# 네이버 API 일일 한도는 한국 시간 자정에 초기화됩니다.
+KST = timezone(timedelta(hours=9))
+
+
+@dataclass
+class NaverCredential:
+    """네이버 API 키 한 쌍과 사용 현황"""
+
+    client_id: str
+    client_secret: str
+    used_today: int = 0
+    cooldown_until: float = 0.0
+    disabled: bool = False
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """이 키로 요청할 때 사용할 인증 헤더"""
+        return {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret,
+        }
+
+
+class NaverQuotaStore:
+    """
+    키별 일일 사용량을 (client_id, 한국 날짜) 단위로 SQLite 파일에 기록하는 클래스
+
+    사용량 증가는 한도를 넘지 않는 경우에만 하나의 UPDATE 문으로 처리하므로
+    여러 프로세스가 동시에 같은 키를 사용해도 한도를 초과하여 배정하지 않습니다.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        사용량 저장소 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS naver_quota (
+                    client_id TEXT NOT NULL,
+                    quota_date TEXT NOT NULL,
+                    used INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (client_id, quota_date)
+                )
+                """
+            )
+
+    def usage(self, quota_date: date) -> Dict[str, int]:
+        """해당 날짜의 키별 사용량을 반환합니다."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT client_id, used FROM naver_quota WHERE quota_date = ?",
+                (quota_date.isoformat(),),
+            ).fetchall()
+        return dict(rows)
+
+    def try_consume(
+        self, client_id: str, quota_date: date, daily_quota: int
+    ) -> Optional[int]:
+        """
+        한도 안에서 키의 사용량을 1 증가시킵니다.
+
+        Returns:
+            증가한 뒤의 사용량, 이미 한도에 도달했으면 None
+        """
+        with self._connect() as connection:
+            # 지난 날짜의 기록은 더 이상 필요하지 않으므로 정리합니다.
+            connection.execute(
+                "DELETE FROM naver_quota WHERE quota_date < ?",
+                (quota_date.isoformat(),),
+            )
+            connection.execute(
+                """
+                INSERT INTO naver_quota (client_id, quota_date, used) VALUES (?, ?, 0)
+                ON CONFLICT (client_id, quota_date) DO NOTHING
+                """,
+                (client_id, quota_date.isoformat()),
+            )
+            row = connection.execute(
+                """
+                UPDATE naver_quota SET used = used + 1
+                WHERE client_id = ? AND quota_date = ? AND used < ?
+                RETURNING used
+                """,
+                (client_id, quota_date.isoformat(), daily_quota),
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_exhausted(
+        self, client_id: str, quota_date: date, daily_quota: int
+    ) -> None:
+        """해당 날짜에 키의 한도가 모두 소진된 것으로 기록합니다."""
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT INTO naver_quota (client_id, quota_date, used) VALUES (?, ?, ?)
+                ON CONFLICT (client_id, quota_date)
+                DO UPDATE SET used = MAX(used, excluded.used)
+                """,
+                (client_id, quota_date.isoformat(), daily_quota),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """작업이 끝나면 커밋하고 연결을 닫는 SQLite 연결을 제공합니다."""
+        connection = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+class NaverCredentialPool:
+    """
+    여러 네이버 API 키 중 호출에 사용할 키를 선택하는 클래스
+
+    키 선택과 사용량 기록은 잠금(lock) 안에서 처리하므로
+    여러 스레드나 요청에서 동시에 사용해도 안전합니다.
+    사용량 저장소(quota_store)가 없으면 사용량은 현재 프로세스 메모리에만 기록됩니다.
+    """
+
+    STRATEGIES = ("round_robin", "least_used")
+    RATE_LIMIT_COOLDOWN_SECONDS = 10.0
+
+    def __init__(
+        self,
+        credentials: List[NaverCredential],
+        daily_quota: int,
+        strategy: str = "round_robin",
+        quota_store: Optional[NaverQuotaStore] = None,
+    ):
+        """
+        키 풀 초기화
+
+        Args:
+            credentials: 사용할 네이버 API 키 목록
+            daily_quota: 키 하나당 하루 호출 한도
+            strategy: 키 선택 전략 (round_robin 또는 least_used)
+            quota_store: 일일 사용량을 프로세스 간에 공유할 저장소
+        """
+        if not credentials:
+            raise ValueError("네이버 API 키가 하나 이상 필요합니다.")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"지원하지 않는 키 선택 전략입니다: {strategy}")
+
+        self.credentials = credentials
+        self.daily_quota = daily_quota
+        self.strategy = strategy
+        self.quota_store = quota_store
+        self._next_index = 0
+        self._quota_date = self._today()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "NaverCredentialPool":
+        """설정의 기본 키와 추가 키 목록으로 키 풀을 생성합니다."""
+        credentials = [
+            NaverCredential(settings.naver_client_id, settings.naver_client_secret)
+        ]
+        for pair in settings.naver_extra_credentials.split(","):
+            client_id, _, client_secret = pair.strip().partition(":")
+            if client_id and client_secret:
+                credentials.append(NaverCredential(client_id, client_secret))
+
+        return cls(
+            credentials=credentials,
+            daily_quota=settings.naver_daily_quota,
+            strategy=settings.naver_credential_strategy,
+            quota_store=(
+                NaverQuotaStore(settings.naver_quota_path)
+                if settings.naver_quota_path
+                else None
+            ),
+        )
+
+    def acquire(self) -> Optional[NaverCredential]:
+        """
+        호출에 사용할 키를 선택하고 사용량을 1 증가시킵니다.
+
+        사용량 저장소를 사용하는 경우 파일 I/O가 발생하므로
+        비동기 코드에서는 별도 스레드에서 호출해야 합니다.
+
+        Returns:
+            사용 가능한 키, 모든 키가 소진되었으면 None
+        """
+        with self._lock:
+            self._reset_quota_if_new_day()
+            self._load_shared_usage()
+            available = [
+                (index, credential)
+                for index, credential in enumerate(self.credentials)
+                if self._is_available(credential)
+            ]
+
+            if self.strategy == "least_used":
+                available.sort(key=lambda x: x[1].used_today)
+            else:
+                # 마지막으로 사용한 키 다음 위치부터 순서대로 시도합니다.
+                available.sort(
+                    key=lambda x: (x[0] - self._next_index) % len(self.credentials)
+                )
+
+            for index, credential in available:
+                if self._consume(credential):
+                    self._next_index = index + 1
+                    return credential
+            return None
+
+    def mark_rate_limited(self, credential: NaverCredential) -> None:
+        """429 응답을 받은 키를 잠시 사용 대상에서 제외합니다."""
+        with self._lock:
+            credential.cooldown_until = (
+                time.monotonic() + self.RATE_LIMIT_COOLDOWN_SECONDS
+            )
+        logger.warning(
+            f"네이버 API 키 한도 초과, {self.RATE_LIMIT_COOLDOWN_SECONDS:.0f}초간 제외: "
+            f"{self._mask(credential.client_id)}"
+        )
+
+    def mark_quota_exhausted(self, credential: NaverCredential) -> None:
+        """일일 한도를 모두 사용한 키를 다음 한국 시간 자정까지 제외합니다."""
+        with self._lock:
+            credential.used_today = max(credential.used_today, self.daily_quota)
+            if self.quota_store is not None:
+                self.quota_store.mark_exhausted(
+                    credential.client_id, self._quota_date, self.daily_quota
+                )
+        logger.warning(
+            f"네이버 API 키 일일 한도 소진, 자정(KST)까지 제외: "
+            f"{self._mask(credential.client_id)}"
+        )
+
+    def mark_invalid(self, credential: NaverCredential) -> None:
+        """401 응답을 받은 키를 사용 대상에서 영구 제외합니다."""
+        with self._lock:
+            credential.disabled = True
+        logger.error(
+            f"유효하지 않은 네이버 API 키 제외: {self._mask(credential.client_id)}"
+        )
+
+    def _is_available(self, credential: NaverCredential) -> bool:
+        return (
+            not credential.disabled
+            and credential.cooldown_until <= time.monotonic()
+            and credential.used_today < self.daily_quota
+        )
+
+    def _load_shared_usage(self) -> None:
+        """다른 프로세스가 기록한 사용량을 반영합니다."""
+        if self.quota_store is None:
+            return
+        usage = self.quota_store.usage(self._quota_date)
+        for credential in self.credentials:
+            credential.used_today = usage.get(credential.client_id, 0)
+
+    def _consume(self, credential: NaverCredential) -> bool:
+        """키의 사용량을 1 증가시키고, 이미 한도에 도달했으면 False를 반환합니다."""
+        if self.quota_store is None:
+            credential.used_today += 1
+            return True
+
+        used = self.quota_store.try_consume(
+            credential.client_id, self._quota_date, self.daily_quota
+        )
+        if used is None:
+            # 다른 프로세스가 먼저 남은 한도를 사용한 경우
+            credential.used_today = self.daily_quota
+            return False
+        credential.used_today = used
+        return True
+
+    def _reset_quota_if_new_day(self) -> None:
+        """날짜가 바뀌었으면 모든 키의 일일 사용량을 초기화합니다."""
+        today = self._today()
+        if today != self._quota_date:
+            self._quota_date = today
+            for credential in self.credentials:
+                credential.used_today = 0
+
+    @staticmethod
+    def _today() -> date:
+        return datetime.now(KST).date()
+
+    @staticmethod
+    def _mask(client_id: str) -> str:
+        """로그에 키 전체가 남지 않도록 앞 4자리만 표시합니다."""
+        return f"{client_id[:4]}****"
@@ -0,0 +1,260 @@
+"""
+크롤링한 블로그 포스트의 로컬 전문 검색(Full-Text Search) 인덱스
+
+크롤링 결과를 SQLite FTS5 인덱스에 저장해 두고, 같은 지역/식당에 대한 검색이
+다시 들어오면 네이버 검색과 크롤링 없이 저장된 포스트로 바로 응답합니다.
+
+한글은 조사가 붙어 띄어쓰기 단위 검색이 잘 맞지 않고, "대전 맛집"처럼 두 글자 단어가
+많아 trigram으로는 찾을 수 없습니다. 그래서 단어를 두 글자씩 나눈 bigram을 토큰으로
+저장하고, 검색어 단어는 연속된 bigram 구문(phrase)으로 찾아 부분 문자열 검색과 같은
+결과를 인덱스와 bm25 순위로 얻습니다. (예: "맛집이" -> "맛집 집이")
+"""
+
+import logging
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from app.models.naver_models import NaverBlogCrawledResponse
+
+logger = logging.getLogger(__name__)
+
+
+class PostIndexService:
+    """
+    크롤링한 포스트를 저장하고 검색어로 조회하는 서비스
+
+    요청마다 새 SQLite 연결을 열기 때문에 여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    # bigram 인덱스로 찾을 수 있는 최소 단어 길이 (한 글자 단어는 검색에서 제외)
+    MIN_INDEXED_TERM_LENGTH = 2
+    # 밑줄을 제외한 글자/숫자 단위의 단어
+    WORD_PATTERN = re.compile(r"[^\W_]+")
+    # bm25 점수 계산 시 열(title, content, address)별 가중치
+    BM25_WEIGHTS = (5.0, 1.0, 3.0)
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS posts (
+            url TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            date TEXT NOT NULL,
+            address TEXT NOT NULL,
+            content TEXT NOT NULL,
+            iframe_used INTEGER NOT NULL,
+            crawled_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS posts_crawled_at ON posts (crawled_at);
+
+        -- posts와 같은 rowid로 bigram으로 나눈 제목/본문/주소를 저장합니다.
+        CREATE VIRTUAL TABLE IF NOT EXISTS posts_bigram USING fts5(
+            title, content, address, tokenize='unicode61'
+        );
+
+        -- 이전 버전의 trigram 인덱스
+        DROP TRIGGER IF EXISTS posts_after_insert;
+        DROP TRIGGER IF EXISTS posts_after_delete;
+        DROP TRIGGER IF EXISTS posts_after_update;
+        DROP TABLE IF EXISTS posts_fts;
+    """
+
+    def __init__(self, db_path: str, min_posts: int = 5, max_age_hours: int = 168):
+        """
+        로컬 인덱스 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            min_posts: 로컬 결과만으로 응답하기 위해 필요한 최소 포스트 수
+            max_age_hours: 로컬 결과로 인정하는 최대 크롤링 경과 시간 (시간)
+        """
+        self.db_path = db_path
+        self.min_posts = min_posts
+        self.max_age_seconds = max_age_hours * 3600
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._create_schema()
+
+    def lookup(
+        self, query: str, limit: int = 30
+    ) -> Optional[List[NaverBlogCrawledResponse]]:
+        """
+        검색어와 관련된 최신 로컬 포스트가 충분히 있으면 반환합니다.
+
+        본문 어딘가에 단어가 등장하는 것만으로는 다른 식당에 대한 글일 수 있으므로,
+        제목이나 주소에 검색어의 모든 단어가 들어 있는 포스트만 커버리지로 인정합니다.
+
+        Returns:
+            로컬 포스트 목록, 관련 포스트 수나 최신성이 부족하면 None
+        """
+        posts = self.search(query, limit=limit)
+        words = self._indexed_words(query)
+        relevant_count = sum(1 for post in posts if self._is_about(post, words))
+        if relevant_count < self.min_posts:
+            logger.info(
+                f"로컬 인덱스 커버리지 부족 ({query}): "
+                f"관련 포스트 {relevant_count}/{self.min_posts}개"
+            )
+            return None
+
+        logger.info(
+            f"로컬 인덱스에서 {len(posts)}개 포스트를 찾았습니다 "
+            f"({query}, 관련 포스트 {relevant_count}개)"
+        )
+        return posts
+
+    def search(self, query: str, limit: int = 30) -> List[NaverBlogCrawledResponse]:
+        """
+        검색어의 모든 단어를 포함하는 최신 포스트를 bm25 관련도 순으로 조회합니다.
+
+        Args:
+            query: 검색어 (두 글자 이상의 단어는 모두 포함되어야 하며, 한 글자 단어는 무시)
+            limit: 최대 반환 개수
+        """
+        words = self._indexed_words(query)
+        if not words:
+            return []
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT posts.* FROM posts_bigram
+                JOIN posts ON posts.rowid = posts_bigram.rowid
+                WHERE posts_bigram MATCH ? AND posts.crawled_at >= ?
+                ORDER BY bm25(posts_bigram, {", ".join(map(str, self.BM25_WEIGHTS))})
+                LIMIT ?
+                """,
+                (
+                    " AND ".join(self._to_phrase(word) for word in words),
+                    time.time() - self.max_age_seconds,
+                    limit,
+                ),
+            ).fetchall()
+
+        return [self._to_response(row) for row in rows]
+
+    def add_posts(self, posts: List[NaverBlogCrawledResponse]) -> None:
+        """크롤링한 포스트를 인덱스에 저장합니다. (같은 URL은 최신 내용으로 갱신)"""
+        crawled_at = time.time()
+        rows = [
+            (
+                post.url,
+                post.title,
+                post.author,
+                post.date,
+                post.address,
+                post.content,
+                int(post.iframe_used),
+                crawled_at,
+            )
+            for post in posts
+        ]
+
+        with self._connect() as connection:
+            connection.executemany(
+                """
+                INSERT INTO posts
+                    (url, title, author, date, address, content, iframe_used, crawled_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    title = excluded.title,
+                    author = excluded.author,
+                    date = excluded.date,
+                    address = excluded.address,
+                    content = excluded.content,
+                    iframe_used = excluded.iframe_used,
+                    crawled_at = excluded.crawled_at
+                """,
+                rows,
+            )
+            self._index_bigrams(connection, [post.url for post in posts])
+
+    def _create_schema(self) -> None:
+        """테이블과 bigram 인덱스를 생성하고, 인덱스가 비어 있으면 다시 채웁니다."""
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(self.SCHEMA)
+
+            indexed = connection.execute("SELECT count(*) FROM posts_bigram").fetchone()
+            if indexed[0] == 0:
+                urls = [row[0] for row in connection.execute("SELECT url FROM posts")]
+                self._index_bigrams(connection, urls)
+
+    def _index_bigrams(self, connection: sqlite3.Connection, urls: List[str]) -> None:
+        """지정한 포스트의 bigram 인덱스를 현재 내용으로 다시 저장합니다."""
+        for url in urls:
+            row = connection.execute(
+                "SELECT rowid, title, content, address FROM posts WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                continue
+            connection.execute("DELETE FROM posts_bigram WHERE rowid = ?", (row[0],))
+            connection.execute(
+                """
+                INSERT INTO posts_bigram (rowid, title, content, address)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    row[0],
+                    self._to_bigram_text(row[1]),
+                    self._to_bigram_text(row[2]),
+                    self._to_bigram_text(row[3]),
+                ),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """작업이 끝나면 커밋하고 연결을 닫는 SQLite 연결을 제공합니다."""
+        connection = sqlite3.connect(self.db_path, timeout=10.0)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _indexed_words(self, query: str) -> List[str]:
+        """검색어에서 bigram 인덱스로 찾을 수 있는 단어를 추출합니다."""
+        return [
+            word
+            for word in self.WORD_PATTERN.findall(query.lower())
+            if len(word) >= self.MIN_INDEXED_TERM_LENGTH
+        ]
+
+    def _to_bigram_text(self, text: str) -> str:
+        """텍스트의 각 단어를 두 글자씩 겹쳐 나눈 토큰 문자열로 변환합니다."""
+        return " ".join(
+            self._bigrams(word) for word in self.WORD_PATTERN.findall(text.lower())
+        )
+
+    def _to_phrase(self, word: str) -> str:
+        """단어를 연속된 bigram 구문으로 변환합니다. (부분 문자열 검색과 같은 결과)"""
+        return '"' + self._bigrams(word) + '"'
+
+    @staticmethod
+    def _bigrams(word: str) -> str:
+        if len(word) < 2:
+            return word
+        return " ".join(word[index : index + 2] for index in range(len(word) - 1))
+
+    @staticmethod
+    def _is_about(post: NaverBlogCrawledResponse, words: List[str]) -> bool:
+        """포스트의 제목이나 주소에 검색어의 모든 단어가 들어 있는지 확인합니다."""
+        topic = f"{post.title} {post.address}".lower()
+        return all(word in topic for word in words)
+
+    @staticmethod
+    def _to_response(row: sqlite3.Row) -> NaverBlogCrawledResponse:
+        return NaverBlogCrawledResponse(
+            title=row["title"],
+            author=row["author"],
+            date=row["date"],
+            address=row["address"],
+            content=row["content"],
+            url=row["url"],
+            iframe_used=bool(row["iframe_used"]),
+        )
@@ -0,0 +1,147 @@
+"""
+검색어와 블로그 포스트의 관련도를 계산하여 순위를 매기는 모듈
+
+문자 n-gram TF-IDF 벡터의 코사인 유사도로 관련도를 구하고, 작성일 기준 최신성을
+함께 반영합니다. 한글은 조사와 띄어쓰기 변형이 많기 때문에 단어 대신 문자 n-gram을 사용하며,
+모든 포스트의 점수는 NumPy 행렬 연산으로 한 번에 계산합니다.
+"""
+
+import re
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.models.naver_models import BlogItem, NaverBlogCrawledResponse
+
+
+class RelevanceRanker:
+    """
+    검색어 관련도와 최신성을 결합한 점수로 포스트 순위를 매기는 클래스
+    """
+
+    # "2024. 5. 3.", "2024-05-03", "20240503" 형식의 날짜
+    DATE_PATTERN = re.compile(r"(\d{4})\D{0,3}(\d{1,2})\D{0,3}(\d{1,2})")
+    # "3시간 전", "10분 전" 처럼 당일 작성된 포스트의 상대 시간 표기
+    RELATIVE_DATE_PATTERN = re.compile(r"\d+\s*(?:초|분|시간)\s*전")
+
+    def __init__(
+        self,
+        ngram_range: Tuple[int, int] = (2, 3),
+        relevance_weight: float = 0.8,
+        recency_half_life_days: float = 180.0,
+        max_text_length: int = 2000,
+    ):
+        """
+        순위 계산기 초기화
+
+        Args:
+            ngram_range: 사용할 문자 n-gram 길이의 범위 (최소, 최대)
+            relevance_weight: 최종 점수에서 관련도가 차지하는 비율 (나머지는 최신성)
+            recency_half_life_days: 최신성 점수가 절반이 되는 경과 일수
+            max_text_length: 관련도 계산에 사용할 포스트 텍스트의 최대 길이
+        """
+        self.ngram_range = ngram_range
+        self.relevance_weight = relevance_weight
+        self.recency_half_life_days = recency_half_life_days
+        self.max_text_length = max_text_length
+
+    def rank_items(
+        self, query: str, items: List[BlogItem], limit: Optional[int] = None
+    ) -> List[BlogItem]:
+        """검색 결과(제목+요약)를 점수 순으로 정렬하여 상위 limit개를 반환합니다."""
+        texts = [f"{item.title} {item.description}" for item in items]
+        dates = [item.post_date for item in items]
+        order = self._rank(query, texts, dates)
+        return [items[index] for index in order[:limit]]
+
+    def rank_posts(
+        self,
+        query: str,
+        posts: List[NaverBlogCrawledResponse],
+        limit: Optional[int] = None,
+    ) -> List[NaverBlogCrawledResponse]:
+        """크롤링한 포스트(제목+본문)를 점수 순으로 정렬하여 상위 limit개를 반환합니다."""
+        texts = [f"{post.title} {post.content}" for post in posts]
+        dates = [post.date for post in posts]
+        order = self._rank(query, texts, dates)
+        return [posts[index] for index in order[:limit]]
+
+    def _rank(
+        self, query: str, texts: Sequence[str], dates: Sequence[str]
+    ) -> List[int]:
+        """결합 점수가 높은 순서대로 포스트의 인덱스를 반환합니다."""
+        if not texts:
+            return []
+
+        relevance = self._relevance_scores(query, texts)
+        if relevance.max() > 0:
+            relevance = relevance / relevance.max()
+        recency = self._recency_scores(dates)
+
+        scores = (
+            self.relevance_weight * relevance + (1 - self.relevance_weight) * recency
+        )
+        # 점수가 같으면 원래 순서(네이버 정확도순)를 유지하도록 안정 정렬을 사용합니다.
+        return np.argsort(-scores, kind="stable").tolist()
+
+    def _relevance_scores(self, query: str, texts: Sequence[str]) -> np.ndarray:
+        """검색어와 각 텍스트 사이의 TF-IDF 코사인 유사도를 계산합니다."""
+        documents = [self._ngrams(query)]
+        documents += [self._ngrams(text[: self.max_text_length]) for text in texts]
+
+        # n-gram마다 열 번호를 부여하고 (문서, n-gram) 위치에 등장 횟수를 누적합니다.
+        vocabulary: dict = {}
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, ngrams in enumerate(documents):
+            for ngram in ngrams:
+                columns.append(vocabulary.setdefault(ngram, len(vocabulary)))
+                rows.append(row)
+
+        counts = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+        np.add.at(counts, (rows, columns), 1)
+
+        # 문서 빈도(df)는 검색어를 제외한 포스트만으로 계산합니다.
+        document_count = len(texts)
+        document_frequency = np.count_nonzero(counts[1:], axis=0)
+        idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+
+        weights = np.log1p(counts) * idf
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        weights /= np.where(norms == 0, 1, norms)
+
+        return weights[1:] @ weights[0]
+
+    def _recency_scores(self, dates: Sequence[str]) -> np.ndarray:
+        """작성일로부터 경과한 일수에 따라 지수적으로 감소하는 최신성 점수를 계산합니다."""
+        today = date.today()
+        ages = np.array(
+            [self._age_in_days(text, today) for text in dates], dtype=np.float64
+        )
+        scores = np.power(0.5, np.maximum(ages, 0) / self.recency_half_life_days)
+        # 작성일을 알 수 없는 포스트는 최신성 점수를 0으로 처리합니다.
+        return np.where(np.isnan(ages), 0.0, scores)
+
+    def _age_in_days(self, text: str, today: date) -> float:
+        if self.RELATIVE_DATE_PATTERN.search(text):
+            return 0.0
+
+        match = self.DATE_PATTERN.search(text)
+        if not match:
+            return np.nan
+        try:
+            year, month, day = (int(value) for value in match.groups())
+            return float((today - date(year, month, day)).days)
+        except ValueError:
+            return np.nan
+
+    def _ngrams(self, text: str) -> List[str]:
+        """공백을 정리한 소문자 텍스트에서 문자 n-gram 목록을 만듭니다."""
+        text = " ".join(text.lower().split())
+        min_n, max_n = self.ngram_range
+        return [
+            text[start : start + n]
+            for n in range(min_n, max_n + 1)
+            for start in range(len(text) - n + 1)
+        ]
@@ -0,0 +1,186 @@
+"""
+캐시 유틸리티
+
+짧은 시간 동안 동일한 요청의 결과를 재사용하기 위한 메모리 TTL 캐시와,
+서버와 배치 작업이 함께 사용할 수 있는 SQLite 기반 영구 캐시를 제공합니다.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)과 최대 항목 수를 가진 간단한 메모리 캐시
+
+    최대 항목 수를 넘으면 가장 먼저 저장된 항목부터 제거합니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        """
+        캐시 초기화
+
+        Args:
+            ttl_seconds: 항목이 유효한 시간 (초, 0 이하이면 캐시 비활성화)
+            max_entries: 저장할 최대 항목 수
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 값을 반환하고, 없거나 만료되었으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장합니다."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+            # 딕셔너리는 삽입 순서를 유지하므로 맨 앞 항목이 가장 오래된 항목입니다.
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCache:
+    """
+    SQLite 파일에 문자열 값을 저장하는 영구 캐시
+
+    여러 프로세스(서버, 배치 CLI)가 같은 파일을 함께 사용할 수 있으며,
+    최대 항목 수나 최대 용량을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            max_entries: 저장할 최대 항목 수
+            ttl_seconds: 항목이 유효한 시간 (초, None이면 만료되지 않음)
+            max_bytes: 저장할 값들의 최대 총 용량 (바이트, None이면 제한 없음)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at);
+                """
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        """만료되지 않은 값을 반환하고, 없거나 만료되었으면 None을 반환합니다."""
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds is not None and created_at + self.ttl_seconds <= now:
+                connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+
+            connection.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """값을 저장하고, 최대 항목 수를 넘은 오래된 항목을 제거합니다."""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT OR REPLACE INTO cache (key, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, value, now, now),
+            )
+            connection.execute(
+                """
+                DELETE FROM cache WHERE key IN (
+                    SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            if self.max_bytes is not None:
+                self._evict_over_capacity(connection)
+
+    def _evict_over_capacity(self, connection: sqlite3.Connection) -> None:
+        """최근 사용 순으로 용량을 누적하여 max_bytes를 넘는 항목을 제거합니다."""
+        connection.execute(
+            """
+            DELETE FROM cache WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(length(CAST(value AS BLOB))) OVER (
+                        ORDER BY accessed_at DESC, key
+                    ) AS total_bytes
+                    FROM cache
+                )
+                WHERE total_bytes > ?
+            )
+            """,
+            (self.max_bytes,),
+        )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """작업이 끝나면 커밋하고 연결을 닫는 SQLite 연결을 제공합니다."""
+        connection = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
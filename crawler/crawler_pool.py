@@ -0,0 +1,132 @@
+"""
+크롤러 인스턴스 풀을 관리하는 모듈
+
+Chrome 실행은 크롤링 한 건보다 오래 걸리는 경우가 많으므로,
+시작된 크롤러를 일정 개수까지 유휴 상태로 보관했다가 재사용합니다.
+서버 시작 시 미리 크롤러를 띄워 두면(pre-warm) 첫 요청의 지연도 줄일 수 있습니다.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
+
+from crawler.utils.crawl_tracer import CrawlTracer
+
+if TYPE_CHECKING:
+    from crawler.naver_blog_crawler import NaverBlogCrawler
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlerPool:
+    """
+    시작된 NaverBlogCrawler를 보관하고 빌려주는 클래스
+
+    Selenium은 무거운 모듈이므로 실제 크롤러가 처음 필요할 때 불러옵니다.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = 0,
+        headless: bool = True,
+        tracer: Optional[CrawlTracer] = None,
+        prefer_mobile: bool = False,
+    ):
+        """
+        크롤러 풀 초기화
+
+        Args:
+            max_idle: 유휴 상태로 보관할 최대 크롤러 수 (0이면 매번 새로 실행)
+            headless: 헤드리스 모드 실행 여부
+            tracer: 크롤러가 단계별 소요 시간을 기록할 트레이서
+            prefer_mobile: 본문을 모바일 PostView 페이지에서 가져올지 여부
+        """
+        self.max_idle = max_idle
+        self.headless = headless
+        self.tracer = tracer
+        self.prefer_mobile = prefer_mobile
+        self._idle: List["NaverBlogCrawler"] = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> "NaverBlogCrawler":
+        """유휴 크롤러를 꺼내고, 없으면 새 크롤러를 시작하여 반환합니다."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._create_crawler()
+
+    def release(self, crawler: "NaverBlogCrawler", healthy: bool = True) -> None:
+        """
+        사용이 끝난 크롤러를 반납합니다.
+
+        Args:
+            crawler: 반납할 크롤러
+            healthy: 재사용해도 되는 상태인지 여부 (False이면 종료)
+        """
+        if healthy:
+            with self._lock:
+                # 풀이 닫힌 뒤 반납된 크롤러는 보관하지 않고 종료합니다.
+                if not self._closed and len(self._idle) < self.max_idle:
+                    self._idle.append(crawler)
+                    return
+        self._stop_crawler(crawler)
+
+    def prewarm(self, count: Optional[int] = None) -> int:
+        """
+        크롤러를 미리 시작하여 유휴 풀을 채웁니다.
+
+        Args:
+            count: 채울 크롤러 수 (기본값: max_idle)
+
+        Returns:
+            새로 시작한 크롤러 수
+        """
+        with self._lock:
+            target = self.max_idle if count is None else min(count, self.max_idle)
+            missing = target - len(self._idle)
+        if missing <= 0:
+            return 0
+
+        # Chrome 실행은 대부분 대기 시간이므로 여러 스레드에서 동시에 시작합니다.
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._create_crawler) for _ in range(missing)]
+
+        started = 0
+        for future in futures:
+            try:
+                self.release(future.result())
+                started += 1
+            except Exception as e:
+                logger.error(f"크롤러 사전 실행 실패: {str(e)}")
+
+        logger.info(f"크롤러 {started}개를 미리 실행했습니다")
+        return started
+
+    def close(self) -> None:
+        """보관 중인 모든 크롤러를 종료하고, 이후 반납되는 크롤러도 바로 종료합니다."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for crawler in idle:
+            self._stop_crawler(crawler)
+
+    @staticmethod
+    def _stop_crawler(crawler: "NaverBlogCrawler") -> None:
+        # 이미 종료된 Chrome을 정리하다 발생한 오류가 크롤링 결과에 영향을 주지 않도록 합니다.
+        try:
+            crawler.stop()
+        except Exception as e:
+            logger.error(f"크롤러 종료 실패: {str(e)}")
+
+    def _create_crawler(self) -> "NaverBlogCrawler":
+        from crawler.naver_blog_crawler import NaverBlogCrawler
+
+        crawler = NaverBlogCrawler(
+            headless=self.headless,
+            tracer=self.tracer,
+            prefer_mobile=self.prefer_mobile,
+        )
+        crawler.start()
+        return crawler
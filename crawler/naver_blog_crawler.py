@@ -1,8 +1,10 @@
 from selenium.webdriver.common.by import By
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
 from crawler.selenium_crawler import SeleniumCrawler
+from crawler.utils.crawl_tracer import CrawlTracer
+from crawler.utils.url_utils import resolve_short_link, to_post_view_url
 
 logger = logging.getLogger(__name__)
 
@@ -46,32 +48,103 @@ class NaverBlogCrawler(SeleniumCrawler):
         "//span[contains(@class, 'se-map-address')]",
         "//div[contains(@class, 'se-map-address')]",
     )
-
-    def __init__(self, headless: bool = False):
-        super().__init__(headless=headless, timeout=15)
+    # 본문 텍스트에서 제외할 스마트에디터 컴포넌트 (지도, 사진 캡션, 스티커, 링크 카드, 해시태그)
+    EXCLUDED_CONTENT_SELECTORS = (
+        ".se-module-map",
+        ".se-placesMap",
+        ".se-map",
+        ".se-caption",
+        ".se-sticker",
+        ".se-oglink",
+        ".se-hashtag",
+        ".post_tag",
+    )
+    # PostView 문서에서 본문이 나타나기를 기다리는 시간 (초)
+    POST_VIEW_TIMEOUT = 10
+
+    def __init__(
+        self,
+        headless: bool = False,
+        tracer: Optional[CrawlTracer] = None,
+        prefer_mobile: bool = False,
+    ):
+        super().__init__(headless=headless, timeout=15, tracer=tracer)
+        # PostView 직접 접근 시 더 가벼운 모바일 페이지를 사용할지 여부
+        self.prefer_mobile = prefer_mobile
 
     def get_blog_content(self, url: str) -> Dict[str, Any]:
+        # 페이지 하나의 모든 단계를 하나의 트레이스로 묶어 기록합니다.
+        with self.tracer.trace(url), self.tracer.span("get_blog_content") as span:
+            blog_data = self._get_blog_content(url)
+            span.outcome = "error" if "error" in blog_data else "ok"
+            return blog_data
+
+    def _get_blog_content(self, url: str) -> Dict[str, Any]:
+        # 본문 문서(PostView)로 바로 이동할 수 있으면 바깥 페이지와 iframe 로딩을 생략합니다.
+        with self.tracer.span("post_view.resolve") as span:
+            post_view_url = to_post_view_url(
+                resolve_short_link(url), mobile=self.prefer_mobile
+            )
+            span.outcome = "ok" if post_view_url else "unsupported"
+
+        if post_view_url:
+            blog_data = self._get_post_view_content(post_view_url, url)
+            if blog_data is not None:
+                return blog_data
+            logger.info(f"PostView 직접 접근 실패, iframe 방식으로 재시도: {url}")
+
+        return self._get_framed_content(url)
+
+    def _get_post_view_content(
+        self, post_view_url: str, url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        PostView 문서를 직접 불러와 블로그 정보를 추출합니다.
+
+        Returns:
+            블로그 정보, 본문을 찾지 못하면 None (iframe 방식으로 재시도)
+        """
+        if not self.get_page(post_view_url):
+            return None
+
+        with self.tracer.span("wait.post_view_content") as span:
+            content_loaded = self.wait_conditions.wait_for_any_xpath(
+                self.driver, self.CONTENT_SELECTORS, timeout=self.POST_VIEW_TIMEOUT
+            )
+            span.outcome = "ok" if content_loaded else "timeout"
+        if not content_loaded:
+            return None
+
+        try:
+            blog_data = self._extract_blog_data(url, iframe_used=False)
+        except Exception as e:
+            logger.warning(f"PostView 컨텐츠 추출 실패: {str(e)}")
+            return None
+
+        return blog_data if blog_data["content"] else None
+
+    def _get_framed_content(self, url: str) -> Dict[str, Any]:
+        """바깥 페이지를 불러온 뒤 mainFrame iframe으로 전환하여 블로그 정보를 추출합니다."""
         if not self.get_page(url):
             return {"error": "페이지 로딩 실패"}
 
         # 네이버 블로그 컨텐츠 로딩을 명시적으로 대기합니다.
-        if not self.wait_conditions.wait_for_naver_blog_content(self.driver):
+        with self.tracer.span("wait.naver_content") as span:
+            content_loaded = self.wait_conditions.wait_for_naver_blog_content(
+                self.driver
+            )
+            span.outcome = "ok" if content_loaded else "timeout"
+        if not content_loaded:
             logger.warning("네이버 블로그 컨텐츠 로딩 대기 실패")
 
         try:
             # iframe으로 전환 시도
-            iframe_switched = self._switch_to_content_iframe()
+            with self.tracer.span("iframe.switch") as span:
+                iframe_switched = self._switch_to_content_iframe()
+                span.outcome = "ok" if iframe_switched else "not_found"
 
             # 블로그 정보 추출
-            blog_data = {
-                "title": self._extract_info(self.TITLE_SELECTORS),
-                "content": self._extract_info(self.CONTENT_SELECTORS, min_length=20),
-                "author": self._extract_info(self.AUTHOR_SELECTORS),
-                "date": self._extract_info(self.DATE_SELECTORS),
-                "address": self._extract_info(self.ADDRESS_SELECTORS),
-                "url": url,
-                "iframe_used": iframe_switched,
-            }
+            blog_data = self._extract_blog_data(url, iframe_used=iframe_switched)
 
             # 메인 프레임으로 복귀
             if iframe_switched:
@@ -83,6 +156,25 @@ class NaverBlogCrawler(SeleniumCrawler):
             logger.error(f"블로그 컨텐츠 추출 실패: {str(e)}")
             return {"error": f"컨텐츠 추출 실패: {str(e)}"}
 
+    def _extract_blog_data(self, url: str, iframe_used: bool) -> Dict[str, Any]:
+        """현재 문서에서 제목, 본문, 작성자, 작성일, 주소를 추출합니다."""
+        # 주소는 지도 컴포넌트 안에 있으므로 본문 추출로 컴포넌트가 제거되기 전에 읽습니다.
+        address = self._extract_info("address", self.ADDRESS_SELECTORS)
+        return {
+            "title": self._extract_info("title", self.TITLE_SELECTORS),
+            "content": self._extract_info(
+                "content",
+                self.CONTENT_SELECTORS,
+                min_length=20,
+                excluded_selectors=self.EXCLUDED_CONTENT_SELECTORS,
+            ),
+            "author": self._extract_info("author", self.AUTHOR_SELECTORS),
+            "date": self._extract_info("date", self.DATE_SELECTORS),
+            "address": address,
+            "url": url,
+            "iframe_used": iframe_used,
+        }
+
     def _switch_to_content_iframe(self) -> bool:
         """
         네이버 블로그의 메인 컨텐츠 iframe으로 전환
@@ -115,15 +207,41 @@ class NaverBlogCrawler(SeleniumCrawler):
             logger.error(f"iframe 전환 중 오류: {str(e)}")
             return False
 
-    def _extract_info(self, selectors: tuple, min_length: int = 1) -> str:
-        for selector in selectors:
-            # 네이버 블로그는 대부분의 콘텐츠가 XPATH로 식별 가능
-            element = self.find_element_safe(By.XPATH, selector, timeout=2)
-            if element:
-                text = self.extract_text(element)
-                if text and len(text.strip()) >= min_length:
-                    logger.debug(f"정보 추출 성공: {selector}")
-                    return text
-
-        logger.warning(f"정보를 찾을 수 없습니다. 시도한 선택자: {selectors}")
-        return ""
+    def _extract_info(
+        self,
+        name: str,
+        selectors: tuple,
+        min_length: int = 1,
+        excluded_selectors: tuple = (),
+    ) -> str:
+        with self.tracer.span(f"extract.{name}") as span:
+            for selector in selectors:
+                # 네이버 블로그는 대부분의 콘텐츠가 XPATH로 식별 가능
+                element = self.find_element_safe(By.XPATH, selector, timeout=2)
+                if element:
+                    if excluded_selectors:
+                        self._remove_components(element, excluded_selectors)
+                    text = self.extract_text(element)
+                    if text and len(text.strip()) >= min_length:
+                        logger.debug(f"정보 추출 성공: {selector}")
+                        span.selector = selector
+                        span.outcome = "hit"
+                        return text
+
+            span.outcome = "miss"
+            logger.warning(f"정보를 찾을 수 없습니다. 시도한 선택자: {selectors}")
+            return ""
+
+    def _remove_components(self, element, selectors: tuple) -> None:
+        """요소 안에서 선택자와 일치하는 하위 컴포넌트를 문서에서 제거합니다."""
+        try:
+            removed = self.driver.execute_script(
+                "const nodes = arguments[0].querySelectorAll(arguments[1]);"
+                "nodes.forEach((node) => node.remove());"
+                "return nodes.length;",
+                element,
+                ", ".join(selectors),
+            )
+            logger.debug(f"본문에서 제외한 컴포넌트 수: {removed}")
+        except Exception as e:
+            logger.debug(f"컴포넌트 제거 실패: {str(e)}")
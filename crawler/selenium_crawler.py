@@ -1,22 +1,31 @@
 from selenium.webdriver.common.by import By
-from typing import List
+from typing import List, Optional
 import logging
 
 from crawler.drivers.driver_manager import DriverManager
+from crawler.utils.crawl_tracer import CrawlTracer
 from crawler.utils.wait_conditions import WaitConditions
 
 logger = logging.getLogger(__name__)
 
 
 class SeleniumCrawler:
-    def __init__(self, headless: bool = False, timeout: int = 10):
+    def __init__(
+        self,
+        headless: bool = False,
+        timeout: int = 10,
+        tracer: Optional[CrawlTracer] = None,
+    ):
         self.driver_manager = DriverManager(headless=headless, timeout=timeout)
         self.driver = None
         self.wait_conditions = WaitConditions()
+        # 트레이서를 지정하지 않으면 아무것도 기록하지 않는 트레이서를 사용합니다.
+        self.tracer = tracer or CrawlTracer()
 
     def start(self):
         try:
-            self.driver = self.driver_manager.create_driver()
+            with self.tracer.span("driver.start"):
+                self.driver = self.driver_manager.create_driver()
             logger.info("크롤러가 시작되었습니다")
         except Exception as e:
             logger.error(f"크롤러 시작 실패: {str(e)}")
@@ -36,10 +45,13 @@ class SeleniumCrawler:
 
         try:
             logger.info(f"페이지 로딩 시작: {url}")
-            self.driver.get(url)
+            with self.tracer.span("page.get"):
+                self.driver.get(url)
 
             if wait_for_load:
-                success = self.wait_conditions.wait_for_page_load(self.driver)
+                with self.tracer.span("wait.page_load") as span:
+                    success = self.wait_conditions.wait_for_page_load(self.driver)
+                    span.outcome = "ok" if success else "timeout"
                 if not success:
                     logger.warning("페이지 로딩 완료 대기 실패")
                     return False
@@ -53,9 +65,11 @@ class SeleniumCrawler:
 
     def find_element_safe(self, by: By, value: str, timeout: int = 10):
         try:
-            element = self.wait_conditions.wait_for_element(
-                self.driver, by, value, timeout
-            )
+            with self.tracer.span("find_element", selector=value) as span:
+                element = self.wait_conditions.wait_for_element(
+                    self.driver, by, value, timeout
+                )
+                span.outcome = "hit" if element else "miss"
             if element:
                 logger.debug(f"요소 검색 성공: {value}")
                 return element
@@ -0,0 +1,158 @@
+"""
+크롤링 트레이스 분석 CLI
+
+CrawlTracer가 기록한 JSONL 트레이스 파일을 읽어 단계별 소요 시간 통계와
+플레임 그래프 형태의 누적 시간 요약을 출력합니다.
+
+사용법:
+    python -m crawler.trace_report traces/crawl.jsonl
+    python -m crawler.trace_report traces/*.jsonl --top 15
+"""
+
+import argparse
+import json
+import math
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+
+REQUIRED_FIELDS = ("step", "path", "duration_ms")
+
+
+def load_spans(paths: Sequence[str]) -> List[dict]:
+    """
+    트레이스 파일들에서 span 기록을 모두 읽어옵니다.
+
+    JSON이 아니거나 span 형식(step, path, duration_ms를 가진 객체)이 아닌 줄은 건너뜁니다.
+    """
+    spans = []
+    for path in paths:
+        with open(path, encoding="utf-8") as trace_file:
+            for line in trace_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and all(
+                    field in record for field in REQUIRED_FIELDS
+                ):
+                    spans.append(record)
+    return spans
+
+
+def percentile(sorted_values: Sequence[float], ratio: float) -> float:
+    """정렬된 값에서 백분위 값을 구합니다. (nearest-rank 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(ratio * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def print_step_table(spans: List[dict], top: int) -> None:
+    """단계(step)별 호출 횟수, 누적 시간, 지연 분포, 결과 분포를 출력합니다."""
+    durations: Dict[str, List[float]] = defaultdict(list)
+    outcomes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for span in spans:
+        durations[span["step"]].append(span["duration_ms"])
+        outcomes[span["step"]][span.get("outcome", "ok")] += 1
+
+    print("\n[단계별 소요 시간]")
+    print(
+        f"{'step':<24}{'count':>7}{'total(s)':>10}{'mean':>9}"
+        f"{'p50':>9}{'p95':>9}{'max':>9}  outcomes"
+    )
+    ranked = sorted(durations.items(), key=lambda x: sum(x[1]), reverse=True)
+    for step, values in ranked[:top]:
+        values.sort()
+        outcome_text = ", ".join(
+            f"{name}={count}" for name, count in sorted(outcomes[step].items())
+        )
+        print(
+            f"{step:<24}{len(values):>7}{sum(values) / 1000:>10.2f}"
+            f"{sum(values) / len(values):>9.0f}{percentile(values, 0.5):>9.0f}"
+            f"{percentile(values, 0.95):>9.0f}{values[-1]:>9.0f}  {outcome_text}"
+        )
+
+
+def print_selector_table(spans: List[dict], top: int) -> None:
+    """선택자별 검색 결과(hit/miss)와 누적 대기 시간을 출력합니다."""
+    totals: Dict[tuple, List[float]] = defaultdict(list)
+    for span in spans:
+        if span["step"] == "find_element" and span.get("selector"):
+            totals[(span["selector"], span.get("outcome", "ok"))].append(
+                span["duration_ms"]
+            )
+
+    if not totals:
+        return
+
+    print("\n[선택자별 대기 시간]")
+    print(f"{'outcome':<8}{'count':>7}{'total(s)':>10}{'mean':>9}  selector")
+    ranked = sorted(totals.items(), key=lambda x: sum(x[1]), reverse=True)
+    for (selector, outcome), values in ranked[:top]:
+        print(
+            f"{outcome:<8}{len(values):>7}{sum(values) / 1000:>10.2f}"
+            f"{sum(values) / len(values):>9.0f}  {selector}"
+        )
+
+
+def print_flame_summary(spans: List[dict], bar_width: int = 40) -> None:
+    """
+    호출 경로(path)별 누적 시간을 트리 형태로 출력합니다.
+
+    각 줄의 막대 길이는 전체 크롤링 시간 대비 해당 경로가 차지하는 비율입니다.
+    """
+    totals: Dict[str, float] = defaultdict(float)
+    for span in spans:
+        totals[span["path"]] += span["duration_ms"]
+
+    root_total = sum(value for path, value in totals.items() if ";" not in path)
+    if root_total <= 0:
+        return
+
+    children: Dict[str, List[str]] = defaultdict(list)
+    for path in totals:
+        parent = path.rpartition(";")[0]
+        children[parent].append(path)
+
+    print("\n[플레임 요약] (전체 대비 누적 시간)")
+
+    def print_node(path: str, depth: int) -> None:
+        share = totals[path] / root_total
+        bar = "█" * max(round(share * bar_width), 1)
+        name = path.rpartition(";")[2]
+        print(
+            f"{'  ' * depth}{name:<{32 - 2 * depth}} "
+            f"{totals[path] / 1000:>8.2f}s {share:>6.1%} {bar}"
+        )
+        for child in sorted(children[path], key=lambda p: totals[p], reverse=True):
+            print_node(child, depth + 1)
+
+    for root in sorted(children[""], key=lambda p: totals[p], reverse=True):
+        print_node(root, 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크롤링 트레이스 분석")
+    parser.add_argument("paths", nargs="+", help="CrawlTracer가 기록한 JSONL 파일")
+    parser.add_argument("--top", type=int, default=20, help="표에 출력할 최대 행 수")
+    args = parser.parse_args()
+
+    spans = load_spans(args.paths)
+    if not spans:
+        print("분석할 트레이스가 없습니다.")
+        return
+
+    pages = [span for span in spans if span["step"] == "get_blog_content"]
+    page_total = sum(span["duration_ms"] for span in pages) / 1000
+    print(f"크롤링 페이지 수: {len(pages)}, 총 span 수: {len(spans)}")
+    if pages:
+        print(f"페이지당 평균 소요 시간: {page_total / len(pages):.2f}초")
+
+    print_step_table(spans, args.top)
+    print_selector_table(spans, args.top)
+    print_flame_summary(spans)
+
+
+if __name__ == "__main__":
+    main()
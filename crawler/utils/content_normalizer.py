@@ -0,0 +1,123 @@
+"""
+크롤링한 블로그 본문을 정제하는 모듈
+
+사진 캡션, 지도 위젯, 스티커 등 스마트에디터 컴포넌트는 텍스트만으로 구분할 수 없으므로
+크롤러가 본문을 추출할 때 제외합니다(NaverBlogCrawler.EXCLUDED_CONTENT_SELECTORS).
+이 모듈은 그 뒤에 남는 공감/댓글 푸터 문구, 해시태그 줄, 이모지만 있는 줄,
+반복 문자와 공백을 정리하여 AI 분석에 사용하는 토큰 수를 줄입니다.
+"""
+
+import re
+from typing import NamedTuple
+
+
+class NormalizedContent(NamedTuple):
+    """정제된 본문과 정제 전후의 바이트 크기"""
+
+    text: str
+    original_bytes: int
+    normalized_bytes: int
+
+    @property
+    def reduced_bytes(self) -> int:
+        """정제로 줄어든 바이트 수"""
+        return self.original_bytes - self.normalized_bytes
+
+    @property
+    def reduction_ratio(self) -> float:
+        """원본 대비 줄어든 비율 (0.0 ~ 1.0)"""
+        if not self.original_bytes:
+            return 0.0
+        return self.reduced_bytes / self.original_bytes
+
+
+class ContentNormalizer:
+    """
+    스마트에디터 보일러플레이트를 제거하는 본문 정제기
+
+    모든 정규식은 클래스 정의 또는 생성 시점에 한 번만 컴파일하고,
+    본문은 줄 단위로 한 번만 순회하며 정제합니다.
+    """
+
+    # 줄 전체가 아래 문구와 정확히 일치하면 제거합니다. (푸터, 에디터 안내 문구 등)
+    # 리뷰 내용이 지워지지 않도록 문구 뒤에 임의의 내용이 오는 줄은 남겨 둡니다.
+    BOILERPLATE_LINE_PATTERN = re.compile(
+        r"^(?:"
+        r"공감(?:\s*\d+)?|댓글(?:\s*\d+)?|이웃\s*추가|구독하기|공유하기|"
+        r"신고하기|URL\s*복사|본문\s*기타\s*기능|글\s*목록|맨\s*위로|"
+        r"좋아요(?:\s*\d+)?|이\s*글에\s*공감한\s*블로거|"
+        r"사진\s*설명을\s*입력하세요\.?|"
+        r"네이버\s*지도|지도\s*보기|길\s*찾기|더보기|접기|펼치기"
+        r")$"
+    )
+    # 해시태그만으로 이루어진 줄 (예: "#대전맛집 #칼국수")
+    HASHTAG_LINE_PATTERN = re.compile(r"^(?:#[^\s#]+\s*)+$")
+    # 글자(한글/영문/숫자)가 하나도 없는 줄 (이모지, 스티커, 구분선 등)
+    WORD_CHAR_PATTERN = re.compile(r"\w")
+    # max_repeat 번보다 많이 반복되는 같은 문자 (예: "ㅋㅋㅋㅋㅋ", "!!!!!")
+    # 가격 등의 숫자와 영문 URL이 손상되지 않도록 영문/숫자는 제외합니다.
+    REPEATED_CHAR_TEMPLATE = r"([^\sA-Za-z0-9])\1{{{max_repeat},}}"
+    # 연속된 공백 문자
+    WHITESPACE_PATTERN = re.compile(r"[ \t\u00a0\u3000]+")
+    # 화면에 보이지 않는 제로폭 문자
+    INVISIBLE_CHAR_PATTERN = re.compile(r"[\u200b\u200c\u200d\u2060\ufeff]")
+
+    def __init__(self, max_repeat: int = 2):
+        """
+        본문 정제기 초기화
+
+        Args:
+            max_repeat: 반복 문자를 남길 최대 글자 수 (1 이상)
+        """
+        if max_repeat < 1:
+            raise ValueError("max_repeat은 1 이상이어야 합니다.")
+        self.max_repeat = max_repeat
+        self.repeated_char_pattern = re.compile(
+            self.REPEATED_CHAR_TEMPLATE.format(max_repeat=max_repeat)
+        )
+
+    def normalize(self, text: str) -> NormalizedContent:
+        """
+        본문 텍스트를 정제합니다.
+
+        Args:
+            text: 크롤링한 원본 본문
+
+        Returns:
+            정제된 본문과 바이트 감소량 정보
+        """
+        original_bytes = len(text.encode("utf-8"))
+        text = self.INVISIBLE_CHAR_PATTERN.sub("", text)
+
+        kept_lines = []
+        previous_line = None
+        for raw_line in text.splitlines():
+            line = self._normalize_line(raw_line)
+            # 빈 줄, 보일러플레이트 줄, 바로 앞 줄과 같은 줄은 건너뜁니다.
+            if not line or line == previous_line or self._is_boilerplate(line):
+                continue
+            kept_lines.append(line)
+            previous_line = line
+
+        normalized_text = "\n".join(kept_lines)
+        return NormalizedContent(
+            text=normalized_text,
+            original_bytes=original_bytes,
+            normalized_bytes=len(normalized_text.encode("utf-8")),
+        )
+
+    def _normalize_line(self, line: str) -> str:
+        """한 줄의 공백과 반복 문자를 축약합니다."""
+        line = self.WHITESPACE_PATTERN.sub(" ", line).strip()
+        return self.repeated_char_pattern.sub(self._shorten_repeat, line)
+
+    def _shorten_repeat(self, match: re.Match) -> str:
+        return match.group(1) * self.max_repeat
+
+    def _is_boilerplate(self, line: str) -> bool:
+        """리뷰 내용과 무관한 줄인지 판별합니다."""
+        return (
+            not self.WORD_CHAR_PATTERN.search(line)
+            or self.HASHTAG_LINE_PATTERN.match(line) is not None
+            or self.BOILERPLATE_LINE_PATTERN.match(line) is not None
+        )
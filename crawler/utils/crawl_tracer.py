@@ -0,0 +1,128 @@
+"""
+크롤링 단계별 소요 시간을 기록하는 트레이싱 모듈
+
+페이지 하나를 크롤링하는 동안 Chrome 실행, 페이지 로딩, 대기 조건, iframe 전환,
+선택자 검색 등 각 단계를 하나의 span으로 기록하여 JSONL 파일에 저장합니다.
+저장된 트레이스는 crawler/trace_report.py 로 집계할 수 있습니다.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """크롤링 단계 하나의 기록"""
+
+    step: str
+    path: str
+    trace_id: str = ""
+    url: str = ""
+    selector: Optional[str] = None
+    outcome: str = "ok"
+    started_at: float = 0.0
+    duration_ms: float = 0.0
+
+
+@dataclass
+class _TraceContext:
+    """스레드별로 현재 진행 중인 트레이스 정보"""
+
+    trace_id: str = ""
+    url: str = ""
+    stack: List[str] = field(default_factory=list)
+
+
+class CrawlTracer:
+    """
+    span을 JSONL 파일에 기록하는 트레이서
+
+    경로를 지정하지 않으면 비활성화되어 아무것도 기록하지 않습니다.
+    하나의 트레이서를 여러 크롤러(스레드)가 함께 사용해도 안전하며,
+    기록에 실패해도 로그만 남기고 크롤링 결과에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        트레이서 초기화
+
+        Args:
+            path: 트레이스를 저장할 JSONL 파일 경로 (None이면 비활성화)
+        """
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.error(f"트레이스 디렉터리 생성 실패 ({path}): {str(e)}")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @contextmanager
+    def trace(self, url: str) -> Iterator[None]:
+        """페이지 하나의 크롤링을 하나의 트레이스로 묶습니다."""
+        context = self._context()
+        previous = (context.trace_id, context.url)
+        context.trace_id, context.url = uuid.uuid4().hex, url
+        try:
+            yield
+        finally:
+            context.trace_id, context.url = previous
+
+    @contextmanager
+    def span(self, step: str, selector: Optional[str] = None) -> Iterator[Span]:
+        """
+        단계 하나의 소요 시간을 측정하여 기록합니다.
+
+        호출한 쪽에서 span.outcome 을 바꾸면 결과(hit/miss 등)가 함께 기록되며,
+        예외가 발생하면 outcome 은 "error"로 기록됩니다.
+        """
+        context = self._context()
+        context.stack.append(step)
+        span = Span(
+            step=step,
+            path=";".join(context.stack),
+            trace_id=context.trace_id,
+            url=context.url,
+            selector=selector,
+            started_at=time.time(),
+        )
+        started_at = time.perf_counter()
+        try:
+            yield span
+        except Exception:
+            span.outcome = "error"
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - started_at) * 1000
+            context.stack.pop()
+            if self.enabled:
+                self._write(span)
+
+    def _write(self, span: Span) -> None:
+        try:
+            line = json.dumps(asdict(span), ensure_ascii=False)
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as trace_file:
+                    trace_file.write(line + "\n")
+        except Exception as e:
+            logger.error(f"트레이스 기록 실패 ({self.path}): {str(e)}")
+
+    def _context(self) -> _TraceContext:
+        if not hasattr(self._local, "context"):
+            self._local.context = _TraceContext()
+        return self._local.context
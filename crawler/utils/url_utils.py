@@ -0,0 +1,99 @@
+"""
+네이버 블로그 URL 변환 유틸리티
+
+검색 결과의 블로그 링크(blog.naver.com/{blogId}/{logNo})는 바깥 껍데기 페이지를 먼저
+불러온 뒤 mainFrame iframe 안에서 본문 문서를 다시 불러옵니다.
+여러 형태의 링크를 본문 문서(PostView) 주소로 바꾸어 한 번의 페이지 로딩으로 본문에 접근합니다.
+"""
+
+import logging
+import re
+import urllib.request
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+logger = logging.getLogger(__name__)
+
+BLOG_HOSTS = ("blog.naver.com", "m.blog.naver.com")
+SHORT_LINK_HOSTS = ("naver.me",)
+POST_VIEW_PATHS = ("/PostView.naver", "/PostView.nhn", "/PostList.naver")
+
+# /{blogId}/{logNo} 형식의 경로
+BLOG_POST_PATH_PATTERN = re.compile(r"^/([A-Za-z0-9_-]+)/(\d+)/?$")
+# /{blogId} 형식의 경로 (logNo는 쿼리스트링에 있는 경우)
+BLOG_ID_PATH_PATTERN = re.compile(r"^/([A-Za-z0-9_-]+)/?$")
+
+
+def parse_blog_post_id(url: str) -> Optional[Tuple[str, str]]:
+    """
+    네이버 블로그 링크에서 블로그 ID와 글 번호(logNo)를 추출합니다.
+
+    지원 형식:
+        - https://blog.naver.com/{blogId}/{logNo}
+        - https://m.blog.naver.com/{blogId}/{logNo}
+        - https://blog.naver.com/PostView.naver?blogId={blogId}&logNo={logNo}
+        - https://blog.naver.com/{blogId}?Redirect=Log&logNo={logNo}
+
+    Returns:
+        (blogId, logNo) 튜플, 알 수 없는 형식이면 None
+    """
+    parsed = urlparse(url)
+    if parsed.hostname not in BLOG_HOSTS:
+        return None
+
+    query = parse_qs(parsed.query)
+    log_no = query.get("logNo", [""])[0]
+
+    match = BLOG_POST_PATH_PATTERN.match(parsed.path)
+    if match:
+        return match.group(1), match.group(2)
+
+    if parsed.path in POST_VIEW_PATHS:
+        blog_id = query.get("blogId", [""])[0]
+    else:
+        match = BLOG_ID_PATH_PATTERN.match(parsed.path)
+        blog_id = match.group(1) if match else ""
+
+    if blog_id and log_no.isdigit():
+        return blog_id, log_no
+    return None
+
+
+def to_post_view_url(url: str, mobile: bool = False) -> Optional[str]:
+    """
+    블로그 링크를 iframe 없이 본문을 바로 불러오는 PostView 주소로 변환합니다.
+
+    Args:
+        url: 네이버 블로그 링크
+        mobile: 더 가벼운 모바일 PostView 주소를 사용할지 여부
+
+    Returns:
+        PostView 주소, 변환할 수 없는 형식이면 None
+    """
+    post_id = parse_blog_post_id(url)
+    if post_id is None:
+        return None
+
+    blog_id, log_no = post_id
+    host = "m.blog.naver.com" if mobile else "blog.naver.com"
+    return f"https://{host}/PostView.naver?" + urlencode(
+        {"blogId": blog_id, "logNo": log_no}
+    )
+
+
+def resolve_short_link(url: str, timeout: float = 5.0) -> str:
+    """
+    naver.me 단축 링크를 리다이렉트를 따라가 원래 주소로 변환합니다.
+
+    단축 링크가 아니거나 변환에 실패하면 입력한 주소를 그대로 반환합니다.
+    """
+    if urlparse(url).hostname not in SHORT_LINK_HOSTS:
+        return url
+
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.geturl()
+    except Exception as e:
+        logger.debug(f"단축 링크 변환 실패 ({url}): {str(e)}")
+        return url
@@ -35,6 +35,18 @@ class WaitConditions:
         except Exception:
             return False
 
+    @staticmethod
+    def wait_for_any_xpath(driver: WebDriver, xpaths: tuple, timeout: int = 10):
+        """여러 XPath 중 하나라도 나타날 때까지 한 번의 대기로 확인합니다."""
+        try:
+            wait = WebDriverWait(driver, timeout)
+            # XPath 합집합(|)을 사용하여 선택자마다 따로 기다리지 않습니다.
+            union_xpath = " | ".join(xpaths)
+            wait.until(EC.presence_of_element_located((By.XPATH, union_xpath)))
+            return True
+        except Exception:
+            return False
+
     @staticmethod
     def wait_for_naver_blog_content(driver: WebDriver, timeout: int = 15):
         try: